@@ -0,0 +1,99 @@
+"""
+Helpers compartilhados pelos dashboards Streamlit (streamlit_app*.py e scripts/investor_demo.py)
+"""
+
+import os
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# LTTB opcional (pip install tsdownsample); sem ele os gráficos recebem a série completa
+try:
+    from tsdownsample import LTTBDownsampler
+    TSDOWNSAMPLE_AVAILABLE = True
+except ImportError:
+    TSDOWNSAMPLE_AVAILABLE = False
+
+# CSS comum dos dashboards
+DASHBOARD_CSS = """
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: bold;
+        color: #FF6B35;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    .metric-card {
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+        padding: 1rem;
+        border-radius: 10px;
+        color: white;
+        text-align: center;
+        margin: 0.5rem 0;
+    }
+    .opportunity-card {
+        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+        padding: 1rem;
+        border-radius: 10px;
+        color: white;
+        margin: 0.5rem 0;
+    }
+    .stTabs [data-baseweb="tab-list"] button [data-testid="stMarkdownContainer"] p {
+        font-size: 1.1rem;
+        font-weight: bold;
+    }
+</style>
+"""
+
+def configure_page():
+    """Configuração da página (sidebar recolhida no Railway para economizar memória)"""
+    if 'RAILWAY_ENVIRONMENT' in os.environ:
+        st.set_page_config(
+            page_title="Skinlytics",
+            page_icon="🎯", 
+            layout="wide",
+            initial_sidebar_state="collapsed"
+        )
+    else:
+        st.set_page_config(
+            page_title="Skinlytics - CS2 Trading Intelligence",
+            page_icon="🎯",
+            layout="wide", 
+            initial_sidebar_state="expanded"
+        )
+
+@st.cache_resource
+def inject_css() -> bool:
+    """Aplica o CSS customizado (nos reruns o elemento é reaproveitado do cache)"""
+    st.markdown(DASHBOARD_CSS, unsafe_allow_html=True)
+    return True
+
+def render_sidebar_features():
+    """Logo e lista de features da sidebar"""
+    st.image("https://via.placeholder.com/200x100/FF6B35/FFFFFF?text=SKINLYTICS", width=200)
+    st.markdown("### 🚀 Features")
+    st.markdown("- 📊 Dados em tempo real")
+    st.markdown("- 🎯 Oportunidades de trading")
+    st.markdown("- 📈 Análise de tendências")
+    st.markdown("- 🔍 Filtros avançados")
+
+@st.cache_data
+def fake_price_timeline(seed: int = 42) -> pd.DataFrame:
+    """Série diária simulada de preços indexada por 'Data' (placeholder até termos histórico real)"""
+    dates = pd.date_range(start='2025-01-01', end='2025-08-06', freq='D', name='Data')
+    prices = np.random.default_rng(seed).normal(100, 20, len(dates)).cumsum()
+    
+    # Já indexada por data: st.line_chart recebe o frame direto, sem set_index por rerun
+    return pd.DataFrame({'Preço': prices}, index=dates)
+
+def downsample_indices(x, y, n_out: int = 500) -> np.ndarray:
+    """Índices dos pontos a plotar: LTTB com no máximo n_out pontos"""
+    y = np.asarray(y)
+    if len(y) <= n_out or not TSDOWNSAMPLE_AVAILABLE:
+        return np.arange(len(y))
+    
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype(np.int64)
+    return LTTBDownsampler().downsample(x, y, n_out=n_out)
@@ -4,6 +4,7 @@
 -- Create extensions
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pg_stat_statements";
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
 
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_skins_market_hash_name ON skins(market_hash_name);
@@ -32,9 +32,256 @@ import logging
 from src.ml.prediction_engine import prediction_engine
 from src.models.hybrid_database import create_hybrid_database
 from monetization_system import monetization_engine
+from demo_data import downsample_indices
 
 logger = logging.getLogger(__name__)
 
+@st.cache_data(ttl=3600)
+def generate_market_data(days: int = 7, seed: int = 42) -> pd.DataFrame:
+    """Gera série horária de volume/transações com um RNG semeado (resultado estável para o cache)"""
+    dates = pd.date_range(start=datetime.now() - timedelta(days=days), end=datetime.now(), freq='h')
+    rng = np.random.default_rng(seed)
+    # float32 basta para gráficos e reduz pela metade o payload das séries
+    values = rng.normal([50_000_000, 25_000], [8_000_000, 3_000], size=(len(dates), 2)).astype(np.float32)
+    
+    return pd.DataFrame({
+        'timestamp': dates,
+        'volume': values[:, 0],
+        'transactions': values[:, 1]
+    })
+
+# HTML/CSS estáticos: montados uma vez no import do módulo
+_CSS = """
+<style>
+.main-header {
+    font-size: 3rem;
+    font-weight: bold;
+    color: #FF6B6B;
+    text-align: center;
+    margin-bottom: 2rem;
+}
+
+.metric-card {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    padding: 1.5rem;
+    border-radius: 15px;
+    color: white;
+    margin-bottom: 1rem;
+    box-shadow: 0 8px 32px rgba(0,0,0,0.1);
+}
+
+.big-number {
+    font-size: 3rem;
+    font-weight: bold;
+    line-height: 1;
+}
+
+.metric-label {
+    font-size: 0.9rem;
+    opacity: 0.8;
+    margin-top: 0.5rem;
+}
+
+.section-header {
+    font-size: 1.8rem;
+    font-weight: bold;
+    color: #2C3E50;
+    margin: 2rem 0 1rem 0;
+    border-bottom: 3px solid #FF6B6B;
+    padding-bottom: 0.5rem;
+}
+
+.highlight-box {
+    background: linear-gradient(135deg, #FF6B6B 0%, #4ECDC4 100%);
+    padding: 1.5rem;
+    border-radius: 10px;
+    color: white;
+    margin: 1rem 0;
+}
+
+.demo-tag {
+    background: #FF6B6B;
+    color: white;
+    padding: 0.3rem 0.8rem;
+    border-radius: 20px;
+    font-size: 0.8rem;
+    font-weight: bold;
+}
+
+.streamlit-expanderHeader {
+    font-weight: bold;
+    font-size: 1.2rem;
+}
+</style>
+"""
+
+_INVESTMENT_THESIS_HTML = """
+<div class="highlight-box">
+    <h3>🎯 Investment Thesis</h3>
+    <p><strong>We're building the Bloomberg Terminal for the $5B+ CS2 skin market.</strong> 
+    Our platform combines real-time data collection, advanced ML predictions, and enterprise-grade 
+    analytics to serve 30M+ traders globally. With proven technology and clear monetization, 
+    we're positioned to capture significant market share in this rapidly growing sector.</p>
+</div>
+"""
+
+_FOOTER_HTML = """
+<div style="text-align: center; padding: 2rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 10px; color: white;">
+    <h3>🚀 Ready to Transform CS2 Trading?</h3>
+    <p>Contact us for a personalized demo and investment discussion</p>
+    <p><strong>Email:</strong> founders@skinlytics.com | <strong>Calendar:</strong> calendly.com/skinlytics-demo</p>
+</div>
+"""
+
+@st.cache_resource
+def _inject_static_html(html: str) -> bool:
+    """Renderiza um bloco HTML estático; nos reruns seguintes o elemento vem do cache"""
+    st.markdown(html, unsafe_allow_html=True)
+    return True
+
+def _hash_frame(df: pd.DataFrame) -> bytes:
+    """Hash de conteúdo do DataFrame usado como chave dos caches de figuras"""
+    return pd.util.hash_pandas_object(df, index=True).values.tobytes()
+
+# Figuras Plotly não são serializáveis: ficam em st.cache_resource e são
+# compartilhadas entre reruns/sessões, por isso nunca devem ser mutadas após o build
+@st.cache_resource(hash_funcs={pd.DataFrame: _hash_frame})
+def _build_volume_fig(volume_data: pd.DataFrame) -> go.Figure:
+    """Gráfico de volume do mercado (WebGL + LTTB para séries longas)"""
+    x = volume_data['timestamp'].to_numpy()
+    y = volume_data['volume'].to_numpy()
+    idx = downsample_indices(x, y)
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=x[idx],
+        y=y[idx],
+        mode='lines',
+        name='Volume (USD)',
+        line=dict(color='#FF6B6B', width=3),
+        fill='tonexty'
+    ))
+    
+    fig.update_layout(
+        title="Market Volume Trend",
+        xaxis_title="Time",
+        yaxis_title="Volume (USD)",
+        template="plotly_dark",
+        height=400
+    )
+    return fig
+
+@st.cache_resource
+def _build_model_bar() -> go.Figure:
+    """Comparação de acurácia dos modelos"""
+    model_data = pd.DataFrame({
+        'Model': ['XGBoost', 'Prophet', 'LSTM', 'Ensemble'],
+        'Accuracy': [89.2, 84.7, 86.3, 91.4],
+        'Usage': [45, 25, 20, 10]
+    })
+    
+    fig = px.bar(model_data, x='Model', y='Accuracy', 
+               title="Model Accuracy Comparison")
+    fig.update_layout(template="plotly_dark", height=300)
+    return fig
+
+@st.cache_resource
+def _build_query_time_hist() -> go.Figure:
+    """Distribuição do tempo de resposta das queries"""
+    query_times = np.random.exponential(0.2, 100)
+    fig = go.Figure(data=[go.Histogram(x=query_times, nbinsx=20)])
+    fig.update_layout(
+        title="Query Response Time Distribution",
+        xaxis_title="Response Time (seconds)",
+        yaxis_title="Frequency",
+        template="plotly_dark",
+        height=300
+    )
+    return fig
+
+@st.cache_resource
+def _build_endpoint_bar(column: str, title: str) -> go.Figure:
+    """Uso da API por endpoint"""
+    endpoint_data = pd.DataFrame({
+        'Endpoint': ['/api/listings', '/api/predictions', '/api/opportunities', '/api/alerts', '/api/analytics'],
+        'Requests': [45000, 23000, 18000, 15000, 12000],
+        'Avg Response (ms)': [120, 340, 180, 95, 220]
+    })
+    
+    fig = px.bar(endpoint_data, x='Endpoint', y=column, title=title)
+    fig.update_layout(template="plotly_dark", height=350)
+    return fig
+
+@st.cache_resource
+def _build_revenue_projection() -> go.Figure:
+    """Projeção de MRR em 3 anos"""
+    months = pd.date_range(start='2024-01-01', periods=36, freq='M')
+    mrr_projection = (45000 * 1.15 ** (np.arange(36) / 12)).astype(np.float32)  # 15% monthly growth
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=months, 
+        y=mrr_projection,
+        mode='lines+markers',
+        name='Projected MRR',
+        line=dict(color='#FF6B6B', width=4)
+    ))
+    
+    # Add milestone markers
+    fig.add_hline(y=100000, line_dash="dash", annotation_text="$100K MRR Target")
+    fig.add_hline(y=1000000, line_dash="dash", annotation_text="$1M MRR Target")
+    
+    fig.update_layout(
+        title="3-Year Revenue Projection",
+        xaxis_title="Time",
+        yaxis_title="Monthly Recurring Revenue (USD)",
+        template="plotly_dark",
+        height=400
+    )
+    return fig
+
+@st.cache_resource
+def _build_acquisition_fig() -> go.Figure:
+    """Aquisição vs churn de clientes"""
+    acquisition_data = pd.DataFrame({
+        'Month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'],
+        'New Customers': [45, 67, 89, 123, 156, 198],
+        'Churned': [3, 5, 7, 8, 12, 15]
+    })
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(name='New Customers', x=acquisition_data['Month'], 
+                       y=acquisition_data['New Customers'], marker_color='#4ECDC4'))
+    fig.add_trace(go.Bar(name='Churned', x=acquisition_data['Month'], 
+                       y=acquisition_data['Churned'], marker_color='#FF6B6B'))
+    
+    fig.update_layout(
+        title="Customer Acquisition vs Churn",
+        barmode='group',
+        template="plotly_dark",
+        height=350
+    )
+    return fig
+
+@st.cache_resource
+def _build_plan_pie() -> go.Figure:
+    """Distribuição de clientes por plano"""
+    plan_data = pd.DataFrame({
+        'Plan': ['Free', 'Pro', 'Enterprise'],
+        'Customers': [834, 387, 26],
+        'Revenue %': [0, 78, 22]
+    })
+    
+    fig = px.pie(plan_data, values='Customers', names='Plan', 
+               title="Customer Distribution by Plan")
+    fig.update_layout(template="plotly_dark", height=350)
+    return fig
+
+@st.cache_data
+def _valuation_projection(monthly_growth: float, time_horizon: int) -> np.ndarray:
+    """Valuation mês a mês, baseado em múltiplo de receita (10x ARR)"""
+    return 542_000 * (1 + monthly_growth) ** np.arange(time_horizon * 12) * 10
+
 class InvestorDemo:
     """Demo interativo para investidores"""
     
@@ -53,98 +300,53 @@ class InvestorDemo:
         # CSS customizado
         self._inject_custom_css()
     
+    @staticmethod
+    def _session_rng() -> np.random.Generator:
+        """Gerador da sessão: persiste entre reruns em vez de usar o estado global do np.random"""
+        if 'rng' not in st.session_state:
+            st.session_state.rng = np.random.default_rng()
+        return st.session_state.rng
+    
     def _inject_custom_css(self):
         """Injeta CSS customizado para aparência profissional"""
-        st.markdown("""
-        <style>
-        .main-header {
-            font-size: 3rem;
-            font-weight: bold;
-            color: #FF6B6B;
-            text-align: center;
-            margin-bottom: 2rem;
-        }
-        
-        .metric-card {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 1.5rem;
-            border-radius: 15px;
-            color: white;
-            margin-bottom: 1rem;
-            box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-        }
-        
-        .big-number {
-            font-size: 3rem;
-            font-weight: bold;
-            line-height: 1;
-        }
-        
-        .metric-label {
-            font-size: 0.9rem;
-            opacity: 0.8;
-            margin-top: 0.5rem;
-        }
-        
-        .section-header {
-            font-size: 1.8rem;
-            font-weight: bold;
-            color: #2C3E50;
-            margin: 2rem 0 1rem 0;
-            border-bottom: 3px solid #FF6B6B;
-            padding-bottom: 0.5rem;
-        }
-        
-        .highlight-box {
-            background: linear-gradient(135deg, #FF6B6B 0%, #4ECDC4 100%);
-            padding: 1.5rem;
-            border-radius: 10px;
-            color: white;
-            margin: 1rem 0;
-        }
-        
-        .demo-tag {
-            background: #FF6B6B;
-            color: white;
-            padding: 0.3rem 0.8rem;
-            border-radius: 20px;
-            font-size: 0.8rem;
-            font-weight: bold;
-        }
-        
-        .streamlit-expanderHeader {
-            font-weight: bold;
-            font-size: 1.2rem;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        _inject_static_html(_CSS)
     
     def _generate_demo_data(self) -> Dict[str, Any]:
         """Gera dados demo realistas"""
         # Simular 90 dias de dados
-        dates = pd.date_range(start=datetime.now() - timedelta(days=90), end=datetime.now(), freq='H')
+        dates = pd.date_range(start=datetime.now() - timedelta(days=90), end=datetime.now(), freq='h')
+        n = len(dates)
+        
+        # Um único gerador PCG64 semeado: todas as colunas saem de uma chamada vetorizada
+        rng = np.random.default_rng(42)
+        market = rng.normal(
+            [50_000_000, 150_000, 25_000, 2_000_000, 50_000],  # $50M daily volume
+            [5_000_000, 15_000, 2_500, 200_000, 5_000],
+            size=(n, 5)
+        )
         
         # Dados de mercado simulados
         market_data = {
             'timestamps': dates,
-            'total_volume': np.random.normal(50_000_000, 5_000_000, len(dates)),  # $50M daily volume
-            'active_listings': np.random.normal(150_000, 15_000, len(dates)),
-            'unique_items': np.random.normal(25_000, 2_500, len(dates)),
-            'api_calls': np.random.normal(2_000_000, 200_000, len(dates)),
-            'ml_predictions': np.random.normal(50_000, 5_000, len(dates))
+            'total_volume': market[:, 0],
+            'active_listings': market[:, 1],
+            'unique_items': market[:, 2],
+            'api_calls': market[:, 3],
+            'ml_predictions': market[:, 4]
         }
         
         # Adicionar tendências realistas
-        trend = np.linspace(0.8, 1.2, len(dates))
+        trend = np.linspace(0.8, 1.2, n)
         market_data['total_volume'] *= trend
         market_data['api_calls'] *= trend
         
         # Dados de performance
+        performance = rng.normal([0.85, 120], [0.05, 20], size=(n, 2))
         performance_data = {
-            'prediction_accuracy': np.random.normal(0.85, 0.05, len(dates)),
-            'api_response_time': np.random.normal(120, 20, len(dates)),  # ms
-            'system_uptime': np.random.choice([0.999, 1.0], len(dates), p=[0.1, 0.9]),
-            'opportunities_detected': np.random.poisson(25, len(dates))  # per hour
+            'prediction_accuracy': performance[:, 0],
+            'api_response_time': performance[:, 1],  # ms
+            'system_uptime': rng.choice([0.999, 1.0], n, p=[0.1, 0.9]),
+            'opportunities_detected': rng.poisson(25, n)  # per hour
         }
         
         # Dados financeiros
@@ -249,23 +451,13 @@ class InvestorDemo:
             </div>
             """, unsafe_allow_html=True)
         
-        st.markdown("""
-        <div class="highlight-box">
-            <h3>🎯 Investment Thesis</h3>
-            <p><strong>We're building the Bloomberg Terminal for the $5B+ CS2 skin market.</strong> 
-            Our platform combines real-time data collection, advanced ML predictions, and enterprise-grade 
-            analytics to serve 30M+ traders globally. With proven technology and clear monetization, 
-            we're positioned to capture significant market share in this rapidly growing sector.</p>
-        </div>
-        """, unsafe_allow_html=True)
+        _inject_static_html(_INVESTMENT_THESIS_HTML)
     
     def render_market_data(self):
         """Renderiza dados de mercado em tempo real"""
         st.markdown('<div class="section-header">📊 Real-Time Market Intelligence</div>', unsafe_allow_html=True)
         
         # Live metrics
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
         metrics = [
             ("Daily Volume", "$52.3M", "+3.2%", "🔥"),
             ("Active Listings", "147.2K", "+1.8%", "📦"),
@@ -274,8 +466,8 @@ class InvestorDemo:
             ("Opportunities", "342", "+8.7%", "💎")
         ]
         
-        for i, (label, value, change, icon) in enumerate(metrics):
-            with [col1, col2, col3, col4, col5][i]:
+        for col, (label, value, change, icon) in zip(st.columns(len(metrics)), metrics):
+            with col:
                 delta_color = "normal" if "+" in change else "inverse"
                 st.metric(f"{icon} {label}", value, change, delta_color=delta_color)
         
@@ -286,32 +478,9 @@ class InvestorDemo:
             st.subheader("📈 Market Volume (Last 7 Days)")
             
             # Generate realistic volume data
-            dates = pd.date_range(start=datetime.now() - timedelta(days=7), end=datetime.now(), freq='H')
-            volume_data = pd.DataFrame({
-                'timestamp': dates,
-                'volume': np.random.normal(50_000_000, 8_000_000, len(dates)),
-                'transactions': np.random.normal(25_000, 3_000, len(dates))
-            })
-            
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=volume_data['timestamp'],
-                y=volume_data['volume'],
-                mode='lines',
-                name='Volume (USD)',
-                line=dict(color='#FF6B6B', width=3),
-                fill='tonexty'
-            ))
-            
-            fig.update_layout(
-                title="Market Volume Trend",
-                xaxis_title="Time",
-                yaxis_title="Volume (USD)",
-                template="plotly_dark",
-                height=400
-            )
+            volume_data = generate_market_data(days=7)
             
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(_build_volume_fig(volume_data), use_container_width=True)
         
         with col2:
             st.subheader("🏆 Top Performing Items")
@@ -352,9 +521,11 @@ class InvestorDemo:
                         time.sleep(2)  # Simulate processing
                         
                         # Mock prediction results
-                        current_price = np.random.uniform(45.0, 150.0)
-                        predicted_price = current_price * np.random.uniform(0.95, 1.15)
-                        confidence = np.random.uniform(75, 95)
+                        # Um único sorteio vetorizado: preço atual, variação prevista e confiança
+                        current_price, change, confidence = self._session_rng().uniform(
+                            [45.0, 0.95, 75], [150.0, 1.15, 95]
+                        )
+                        predicted_price = current_price * change
                         
                         col_a, col_b = st.columns(2)
                         with col_a:
@@ -380,8 +551,8 @@ class InvestorDemo:
                 st.subheader("Prediction Confidence Over Time")
                 
                 # Generate confidence chart
-                hours = list(range(24))
-                confidence_data = [85 + 10 * np.sin(i/3) + np.random.normal(0, 2) for i in hours]
+                hours = np.arange(24)
+                confidence_data = (85 + 10 * np.sin(hours / 3) + self._session_rng().normal(0, 2, hours.size)).astype(np.float32)
                 
                 fig = go.Figure()
                 fig.add_trace(go.Scatter(
@@ -422,16 +593,7 @@ class InvestorDemo:
             
             with col3:
                 st.markdown("### 📊 Model Types")
-                model_data = pd.DataFrame({
-                    'Model': ['XGBoost', 'Prophet', 'LSTM', 'Ensemble'],
-                    'Accuracy': [89.2, 84.7, 86.3, 91.4],
-                    'Usage': [45, 25, 20, 10]
-                })
-                
-                fig = px.bar(model_data, x='Model', y='Accuracy', 
-                           title="Model Accuracy Comparison")
-                fig.update_layout(template="plotly_dark", height=300)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_build_model_bar(), use_container_width=True)
         
         with tab3:
             st.subheader("🔍 Opportunity Detection Engine")
@@ -493,16 +655,7 @@ class InvestorDemo:
                 st.metric("Partitions", "2,847", "Auto-managed")
                 
                 # Query performance chart
-                query_times = np.random.exponential(0.2, 100)
-                fig = go.Figure(data=[go.Histogram(x=query_times, nbinsx=20)])
-                fig.update_layout(
-                    title="Query Response Time Distribution",
-                    xaxis_title="Response Time (seconds)",
-                    yaxis_title="Frequency",
-                    template="plotly_dark",
-                    height=300
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_build_query_time_hist(), use_container_width=True)
         
         with tab2:
             st.subheader("API Performance Metrics")
@@ -528,24 +681,12 @@ class InvestorDemo:
                 st.metric("Uptime", "99.97%", "SLA: 99.9%")
             
             # API usage by endpoint
-            endpoint_data = pd.DataFrame({
-                'Endpoint': ['/api/listings', '/api/predictions', '/api/opportunities', '/api/alerts', '/api/analytics'],
-                'Requests': [45000, 23000, 18000, 15000, 12000],
-                'Avg Response (ms)': [120, 340, 180, 95, 220]
-            })
-            
             col1, col2 = st.columns(2)
             with col1:
-                fig = px.bar(endpoint_data, x='Endpoint', y='Requests', 
-                           title="Requests by Endpoint (24h)")
-                fig.update_layout(template="plotly_dark", height=350)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_build_endpoint_bar('Requests', "Requests by Endpoint (24h)"), use_container_width=True)
             
             with col2:
-                fig = px.bar(endpoint_data, x='Endpoint', y='Avg Response (ms)', 
-                           title="Average Response Time by Endpoint")
-                fig.update_layout(template="plotly_dark", height=350)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_build_endpoint_bar('Avg Response (ms)', "Average Response Time by Endpoint"), use_container_width=True)
         
         with tab3:
             st.subheader("System Health Dashboard")
@@ -617,31 +758,7 @@ class InvestorDemo:
             # Revenue projection
             st.subheader("📊 Revenue Projection")
             
-            months = pd.date_range(start='2024-01-01', periods=36, freq='M')
-            mrr_projection = [45000 * (1.15 ** (i/12)) for i in range(36)]  # 15% monthly growth
-            
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=months, 
-                y=mrr_projection,
-                mode='lines+markers',
-                name='Projected MRR',
-                line=dict(color='#FF6B6B', width=4)
-            ))
-            
-            # Add milestone markers
-            fig.add_hline(y=100000, line_dash="dash", annotation_text="$100K MRR Target")
-            fig.add_hline(y=1000000, line_dash="dash", annotation_text="$1M MRR Target")
-            
-            fig.update_layout(
-                title="3-Year Revenue Projection",
-                xaxis_title="Time",
-                yaxis_title="Monthly Recurring Revenue (USD)",
-                template="plotly_dark",
-                height=400
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(_build_revenue_projection(), use_container_width=True)
         
         with tab2:
             st.subheader("Customer Analytics")
@@ -650,38 +767,11 @@ class InvestorDemo:
             
             with col1:
                 # Customer acquisition
-                acquisition_data = pd.DataFrame({
-                    'Month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'],
-                    'New Customers': [45, 67, 89, 123, 156, 198],
-                    'Churned': [3, 5, 7, 8, 12, 15]
-                })
-                
-                fig = go.Figure()
-                fig.add_trace(go.Bar(name='New Customers', x=acquisition_data['Month'], 
-                                   y=acquisition_data['New Customers'], marker_color='#4ECDC4'))
-                fig.add_trace(go.Bar(name='Churned', x=acquisition_data['Month'], 
-                                   y=acquisition_data['Churned'], marker_color='#FF6B6B'))
-                
-                fig.update_layout(
-                    title="Customer Acquisition vs Churn",
-                    barmode='group',
-                    template="plotly_dark",
-                    height=350
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_build_acquisition_fig(), use_container_width=True)
             
             with col2:
                 # Plan distribution
-                plan_data = pd.DataFrame({
-                    'Plan': ['Free', 'Pro', 'Enterprise'],
-                    'Customers': [834, 387, 26],
-                    'Revenue %': [0, 78, 22]
-                })
-                
-                fig = px.pie(plan_data, values='Customers', names='Plan', 
-                           title="Customer Distribution by Plan")
-                fig.update_layout(template="plotly_dark", height=350)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(_build_plan_pie(), use_container_width=True)
         
         with tab3:
             st.subheader("🎯 Investment ROI Calculator")
@@ -715,12 +805,7 @@ class InvestorDemo:
                 months = list(range(time_horizon * 12))
                 current_valuation = 10_000_000  # $10M current valuation
                 
-                valuations = []
-                for month in months:
-                    # Simple valuation based on revenue multiple (10x ARR)
-                    arr = 542_000 * ((1 + monthly_growth) ** month)
-                    valuation = arr * 10
-                    valuations.append(valuation)
+                valuations = _valuation_projection(monthly_growth, time_horizon)
                 
                 final_valuation = valuations[-1]
                 investment_value = (equity_percentage / 100) * final_valuation
@@ -739,7 +824,7 @@ class InvestorDemo:
                 fig = go.Figure()
                 fig.add_trace(go.Scatter(
                     x=[f"Year {i//12 + 1}" for i in months[::12]],
-                    y=[v/1_000_000 for v in valuations[::12]],
+                    y=(valuations[::12] / 1_000_000).astype(np.float32),
                     mode='lines+markers',
                     name='Company Valuation',
                     line=dict(color='#4ECDC4', width=4)
@@ -911,13 +996,7 @@ class InvestorDemo:
         
         # Footer
         st.markdown("---")
-        st.markdown("""
-        <div style="text-align: center; padding: 2rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 10px; color: white;">
-            <h3>🚀 Ready to Transform CS2 Trading?</h3>
-            <p>Contact us for a personalized demo and investment discussion</p>
-            <p><strong>Email:</strong> founders@skinlytics.com | <strong>Calendar:</strong> calendly.com/skinlytics-demo</p>
-        </div>
-        """, unsafe_allow_html=True)
+        _inject_static_html(_FOOTER_HTML)
 
 # Main execution
 if __name__ == "__main__":
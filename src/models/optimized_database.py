@@ -6,11 +6,12 @@ Esta versão remove campos desnecessários para manter o banco leve,
 rápido e focado nos dados essenciais para análise de mercado.
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, Index
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 import logging
 
@@ -55,6 +56,12 @@ class Skin(Base):
     
     # Relacionamentos
     listings = relationship('ListingOptimized', back_populates='skin', cascade='all, delete-orphan')
+    
+    # Índice trigram (pg_trgm) para buscas ILIKE '%termo%' no Explorer
+    __table_args__ = (
+        Index('idx_skin_name_trgm', 'market_hash_name',
+              postgresql_using='gin', postgresql_ops={'market_hash_name': 'gin_trgm_ops'}),
+    )
 
 class ListingOptimized(Base):
     """
@@ -100,6 +107,7 @@ class ListingOptimized(Base):
     __table_args__ = (
         Index('idx_skin_price_date', 'skin_id', 'price', 'collected_at'),
         Index('idx_price_float', 'price', 'float_value'),
+        Index('idx_price_positive', 'price', postgresql_where=text('price > 0')),  # Soma/valor total
         Index('idx_seller_performance', 'seller_total_trades', 'seller_verified_trades'),
     )
 
@@ -156,22 +164,38 @@ def get_database_url():
         return os.getenv('DATABASE_URL')
     return 'sqlite:///./data/skins_optimized.db'
 
+@lru_cache(maxsize=1)
 def get_engine():
-    """Create database engine"""
+    """Create database engine (um por processo, com pool de conexões reaproveitado)"""
     database_url = get_database_url()
-    return create_engine(database_url, echo=False)  # Desabilitar echo para performance
+    if database_url.startswith('sqlite'):
+        return create_engine(database_url, echo=False)  # Desabilitar echo para performance
+    return create_engine(
+        database_url,
+        echo=False,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True  # Descarta conexões derrubadas pelo servidor
+    )
+
+@lru_cache(maxsize=1)
+def _session_factory():
+    """sessionmaker ligado ao engine compartilhado"""
+    return sessionmaker(bind=get_engine())
 
 def create_tables():
     """Create all tables"""
     engine = get_engine()
+    if engine.dialect.name == 'postgresql':
+        # Necessário para o índice trigram de market_hash_name
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(engine)
     logger.info("Tabelas otimizadas criadas com sucesso!")
 
 def get_session():
     """Create database session"""
-    engine = get_engine()
-    Session = sessionmaker(bind=engine)
-    return Session()
+    return _session_factory()()
 
 if __name__ == "__main__":
     create_tables()
\ No newline at end of file
@@ -313,6 +313,25 @@ class AggregationService:
             self.logger.error(f"❌ Erro no cleanup: {e}")
             return False
     
+    def refresh_price_rollup(self) -> bool:
+        """Atualiza a materialized view mv_price_daily do dashboard, se existir"""
+        try:
+            if self.session.bind.dialect.name != 'postgresql':
+                return True
+            
+            exists = self.session.execute(text("SELECT to_regclass('mv_price_daily')")).scalar()
+            if exists:
+                self.session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_price_daily"))
+                self.session.commit()
+                self.logger.info("✅ Rollup mv_price_daily atualizado")
+            return True
+            
+        except Exception as e:
+            self.session.rollback()
+            self.logger.error(f"❌ Erro ao atualizar mv_price_daily: {e}")
+            self.stats['errors'] += 1
+            return False
+    
     def run_daily_aggregation(self) -> Dict:
         """Executa agregação diária completa"""
         try:
@@ -335,6 +354,9 @@ class AggregationService:
             # 3. Cleanup de dados antigos
             self.cleanup_old_data()
             
+            # 4. Atualizar o rollup diário lido pelo dashboard
+            self.refresh_price_rollup()
+            
             # Calcular tempo total
             duration = datetime.now() - self.stats['start_time']
             
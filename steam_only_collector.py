@@ -13,6 +13,13 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import csv
 import os
+import re
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configuração de logging
 logging.basicConfig(
@@ -25,6 +32,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# O payload do priceoverview tem formato fixo e pequeno; extrair os campos
+# direto dos bytes evita passar pelo parser JSON completo
+_SUCCESS_RE = re.compile(rb'"success":(true|false)')
+_MEDIAN_RE = re.compile(rb'"median_price":"([^"\\]+)"')
+_LOWEST_RE = re.compile(rb'"lowest_price":"([^"\\]+)"')
+_VOLUME_RE = re.compile(rb'"volume":"([^"\\]+)"')
+
+def _parse_priceoverview(raw: bytes) -> Dict:
+    """Extrai success/median/lowest/volume do payload do priceoverview"""
+    success = _SUCCESS_RE.search(raw)
+    median = _MEDIAN_RE.search(raw)
+    lowest = _LOWEST_RE.search(raw)
+    
+    # Fallback para o parser completo se o formato não for o esperado
+    if not (success and median and lowest):
+        return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    
+    data = {
+        'success': success.group(1) == b'true',
+        'lowest_price': lowest.group(1).decode('utf-8'),
+        'median_price': median.group(1).decode('utf-8')
+    }
+    volume = _VOLUME_RE.search(raw)
+    if volume:
+        data['volume'] = volume.group(1).decode('utf-8')
+    return data
+
 class SteamOnlyCollector:
     def __init__(self):
         self.session = None
@@ -142,7 +176,7 @@ class SteamOnlyCollector:
                 
                 async with self.session.get(self.steam_market_base, params=params) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = _parse_priceoverview(await response.read())
                         if data.get('success'):
                             results[market_hash_name] = {
                                 'source': 'steam_market',
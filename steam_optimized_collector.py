@@ -6,14 +6,33 @@ Estratégias inteligentes para maximizar dados coletados
 
 import asyncio
 import aiohttp
+import yarl
 import json
 import time
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional
 import csv
 import os
 import random
+import statistics
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from itertools import islice
+import re
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Configuração de logging
 logging.basicConfig(
@@ -26,18 +45,283 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Classificação de skins em uma única passada
+WEAR_RE = re.compile(r'\((Factory New|Minimal Wear|Field-Tested|Well-Worn|Battle-Scarred)\)$')
+WEAPON_RE = re.compile(r'^(?:★ )?(?:StatTrak™ |Souvenir )?([^|]+?) \|')
+WEAPON_CATEGORIES = {
+    'AK-47': 'Rifle', 'M4A4': 'Rifle', 'M4A1-S': 'Rifle',
+    'AWP': 'Sniper',
+    'USP-S': 'Pistol', 'Glock-18': 'Pistol', 'Desert Eagle': 'Pistol',
+    'Karambit': 'Knife', 'M9 Bayonet': 'Knife', 'Butterfly Knife': 'Knife',
+    'Hand Wraps': 'Gloves'
+}
+
+_PRICE_RE = re.compile(r'[\d.]+')
+
+def parse_price(price: str) -> float:
+    """Converte preço do Steam ('$1,234.56') para float, 0.0 se inválido"""
+    match = _PRICE_RE.search(price.replace(',', ''))
+    if not match:
+        return 0.0
+    try:
+        return float(match.group())
+    except ValueError:
+        return 0.0
+
+class SkinClassification(NamedTuple):
+    category: str
+    wear: Optional[str]
+    rarity: str
+
+@lru_cache(maxsize=4096)
+def classify(skin_name: str) -> SkinClassification:
+    """Classifica skin em (categoria, wear, raridade) - cacheado por nome"""
+    weapon_match = WEAPON_RE.match(skin_name)
+    weapon = weapon_match.group(1) if weapon_match else ''
+    if weapon.endswith('Gloves'):
+        category = 'Gloves'
+    else:
+        category = WEAPON_CATEGORIES.get(weapon, 'Other')
+    
+    wear_match = WEAR_RE.search(skin_name)
+    wear = wear_match.group(1) if wear_match else None
+    
+    if 'Dragon Lore' in skin_name or 'Howl' in skin_name:
+        rarity = 'Legendary'
+    elif 'Fade' in skin_name:
+        rarity = 'Epic'
+    elif wear == 'Factory New':
+        rarity = 'Rare'
+    elif wear == 'Minimal Wear':
+        rarity = 'Uncommon'
+    else:
+        rarity = 'Common'
+    
+    return SkinClassification(category, wear, rarity)
+
+# Lista estendida de skins populares
+BASE_SKINS = [
+    # AK-47 Series
+    "AK-47 | Redline (Field-Tested)", "AK-47 | Redline (Minimal Wear)",
+    "AK-47 | Redline (Well-Worn)", "AK-47 | Redline (Battle-Scarred)",
+    "AK-47 | Redline (Factory New)", "AK-47 | Asiimov (Field-Tested)",
+    "AK-47 | Asiimov (Minimal Wear)", "AK-47 | Asiimov (Well-Worn)",
+    "AK-47 | Asiimov (Battle-Scarred)", "AK-47 | Asiimov (Factory New)",
+    
+    # M4A4 Series
+    "M4A4 | Desolate Space (Field-Tested)", "M4A4 | Desolate Space (Minimal Wear)",
+    "M4A4 | Desolate Space (Well-Worn)", "M4A4 | Desolate Space (Battle-Scarred)",
+    "M4A4 | Desolate Space (Factory New)", "M4A4 | Howl (Factory New)",
+    "M4A4 | Howl (Minimal Wear)", "M4A4 | Howl (Field-Tested)",
+    
+    # AWP Series
+    "AWP | Dragon Lore (Factory New)", "AWP | Dragon Lore (Minimal Wear)",
+    "AWP | Dragon Lore (Field-Tested)", "AWP | Dragon Lore (Well-Worn)",
+    "AWP | Dragon Lore (Battle-Scarred)", "AWP | Medusa (Factory New)",
+    "AWP | Medusa (Minimal Wear)", "AWP | Medusa (Field-Tested)",
+    
+    # M4A1-S Series
+    "M4A1-S | Hyper Beast (Field-Tested)", "M4A1-S | Hyper Beast (Minimal Wear)",
+    "M4A1-S | Hyper Beast (Well-Worn)", "M4A1-S | Hyper Beast (Battle-Scarred)",
+    "M4A1-S | Hyper Beast (Factory New)", "M4A1-S | Master Piece (Factory New)",
+    
+    # USP-S Series
+    "USP-S | Kill Confirmed (Field-Tested)", "USP-S | Kill Confirmed (Minimal Wear)",
+    "USP-S | Kill Confirmed (Well-Worn)", "USP-S | Kill Confirmed (Battle-Scarred)",
+    "USP-S | Kill Confirmed (Factory New)", "USP-S | Kill Confirmed (Minimal Wear)",
+    
+    # Glock Series
+    "Glock-18 | Water Elemental (Field-Tested)", "Glock-18 | Water Elemental (Minimal Wear)",
+    "Glock-18 | Water Elemental (Well-Worn)", "Glock-18 | Water Elemental (Battle-Scarred)",
+    "Glock-18 | Water Elemental (Factory New)", "Glock-18 | Fade (Factory New)",
+    
+    # Desert Eagle Series
+    "Desert Eagle | Golden Koi (Field-Tested)", "Desert Eagle | Golden Koi (Minimal Wear)",
+    "Desert Eagle | Golden Koi (Well-Worn)", "Desert Eagle | Golden Koi (Battle-Scarred)",
+    "Desert Eagle | Golden Koi (Factory New)", "Desert Eagle | Blaze (Factory New)",
+    
+    # Knife Series
+    "Karambit | Fade (Factory New)", "Karambit | Fade (Minimal Wear)",
+    "Karambit | Fade (Field-Tested)", "Karambit | Fade (Well-Worn)",
+    "Karambit | Fade (Battle-Scarred)", "Karambit | Marble Fade (Factory New)",
+    "M9 Bayonet | Marble Fade (Factory New)", "M9 Bayonet | Marble Fade (Minimal Wear)",
+    "Butterfly Knife | Fade (Factory New)", "Butterfly Knife | Fade (Minimal Wear)",
+    
+    # Hand Wraps Series
+    "★ Hand Wraps | CAUTION! (Field-Tested)", "★ Hand Wraps | CAUTION! (Minimal Wear)",
+    "★ Hand Wraps | CAUTION! (Well-Worn)", "★ Hand Wraps | CAUTION! (Battle-Scarred)",
+    "★ Hand Wraps | CAUTION! (Factory New)", "★ Hand Wraps | Desert Shamagh (Field-Tested)",
+    "★ Hand Wraps | Desert Shamagh (Minimal Wear)", "★ Hand Wraps | Desert Shamagh (Well-Worn)",
+    "★ Hand Wraps | Desert Shamagh (Battle-Scarred)", "★ Hand Wraps | Desert Shamagh (Factory New)",
+    
+    # Specialist Gloves Series
+    "★ Specialist Gloves | Crimson Kimono (Field-Tested)", "★ Specialist Gloves | Crimson Kimono (Minimal Wear)",
+    "★ Specialist Gloves | Crimson Kimono (Well-Worn)", "★ Specialist Gloves | Crimson Kimono (Battle-Scarred)",
+    "★ Specialist Gloves | Crimson Kimono (Factory New)", "★ Specialist Gloves | Emerald Web (Field-Tested)",
+    
+    # Driver Gloves Series
+    "★ Driver Gloves | Crimson Weave (Field-Tested)", "★ Driver Gloves | Crimson Weave (Minimal Wear)",
+    "★ Driver Gloves | Crimson Weave (Well-Worn)", "★ Driver Gloves | Crimson Weave (Battle-Scarred)",
+    "★ Driver Gloves | Crimson Weave (Factory New)", "★ Driver Gloves | Lunar Weave (Field-Tested)",
+    
+    # Sport Gloves Series
+    "★ Sport Gloves | Vice (Field-Tested)", "★ Sport Gloves | Vice (Minimal Wear)",
+    "★ Sport Gloves | Vice (Well-Worn)", "★ Sport Gloves | Vice (Battle-Scarred)",
+    "★ Sport Gloves | Vice (Factory New)", "★ Sport Gloves | Pandora's Box (Field-Tested)"
+]
+
+# Mais variações
+ADDITIONAL_SKINS = [
+    "AK-47 | Bloodsport (Field-Tested)", "AK-47 | Bloodsport (Minimal Wear)",
+    "AK-47 | Bloodsport (Well-Worn)", "AK-47 | Bloodsport (Battle-Scarred)",
+    "AK-47 | Bloodsport (Factory New)", "AK-47 | Fire Serpent (Field-Tested)",
+    "AK-47 | Fire Serpent (Minimal Wear)", "AK-47 | Fire Serpent (Well-Worn)",
+    "AK-47 | Fire Serpent (Battle-Scarred)", "AK-47 | Fire Serpent (Factory New)",
+    
+    "M4A4 | Evil Daimyo (Field-Tested)", "M4A4 | Evil Daimyo (Minimal Wear)",
+    "M4A4 | Evil Daimyo (Well-Worn)", "M4A4 | Evil Daimyo (Battle-Scarred)",
+    "M4A4 | Evil Daimyo (Factory New)", "M4A4 | Royal Paladin (Field-Tested)",
+    
+    "AWP | Lightning Strike (Factory New)", "AWP | Lightning Strike (Minimal Wear)",
+    "AWP | Lightning Strike (Field-Tested)", "AWP | Lightning Strike (Well-Worn)",
+    "AWP | Lightning Strike (Battle-Scarred)", "AWP | Graphite (Field-Tested)",
+    
+    "M4A1-S | Cyrex (Field-Tested)", "M4A1-S | Cyrex (Minimal Wear)",
+    "M4A1-S | Cyrex (Well-Worn)", "M4A1-S | Cyrex (Battle-Scarred)",
+    "M4A1-S | Cyrex (Factory New)", "M4A1-S | Golden Coil (Field-Tested)",
+    
+    "USP-S | Caiman (Field-Tested)", "USP-S | Caiman (Minimal Wear)",
+    "USP-S | Caiman (Well-Worn)", "USP-S | Caiman (Battle-Scarred)",
+    "USP-S | Caiman (Factory New)", "USP-S | Road Rash (Field-Tested)",
+    
+    "Glock-18 | Twilight Galaxy (Field-Tested)", "Glock-18 | Twilight Galaxy (Minimal Wear)",
+    "Glock-18 | Twilight Galaxy (Well-Worn)", "Glock-18 | Twilight Galaxy (Battle-Scarred)",
+    "Glock-18 | Twilight Galaxy (Factory New)", "Glock-18 | Candy Apple (Field-Tested)",
+    
+    "Desert Eagle | Sunset Storm (Field-Tested)", "Desert Eagle | Sunset Storm (Minimal Wear)",
+    "Desert Eagle | Sunset Storm (Well-Worn)", "Desert Eagle | Sunset Storm (Battle-Scarred)",
+    "Desert Eagle | Sunset Storm (Factory New)", "Desert Eagle | Hypnotic (Field-Tested)"
+]
+
+# Deduplicada preservando a ordem
+POPULAR_SKINS = tuple(dict.fromkeys(BASE_SKINS + ADDITIONAL_SKINS))
+
+# Estratégia weapon_categories: rifles e snipers (AK-47, M4A4, AWP, M4A1-S), pré-computada
+WEAPON_CATEGORY_SKINS = tuple(skin for skin in POPULAR_SKINS if classify(skin).category in ('Rifle', 'Sniper'))
+
+# Sessão HTTP compartilhada entre instâncias do coletor (reaproveita conexões TLS)
+_session: Optional[aiohttp.ClientSession] = None
+
+async def get_session() -> aiohttp.ClientSession:
+    """Retorna a sessão compartilhada, criando-a na primeira chamada"""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=8,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={
+                'User-Agent': 'Skinlytics/2.0 (Portfolio Project)',
+                'Accept': 'application/json'
+            }
+        )
+    return _session
+
+async def close_session():
+    """Fecha a sessão compartilhada (chamar no encerramento)"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+class AdaptiveConcurrencyLimiter:
+    """Limite de concorrência adaptativo (AIMD) guiado por latência e respostas 429"""
+    
+    def __init__(self, initial_limit: int = 8, min_limit: int = 1, max_limit: int = 16,
+                 increase_after: int = 10, window: int = 50):
+        self.inflight_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_after = increase_after  # Sucessos seguidos para crescer o limite
+        self.latencies = deque(maxlen=window)
+        self.consecutive_successes = 0
+        
+        # Um único contador de vagas: mudanças no limite valem já para quem está esperando
+        self._in_flight = 0
+        self._slots = None  # asyncio.Condition, criada no event loop em uso
+    
+    @asynccontextmanager
+    async def use(self):
+        """Ocupa uma vaga de requisição simultânea"""
+        if self._slots is None:
+            self._slots = asyncio.Condition()
+        
+        async with self._slots:
+            await self._slots.wait_for(lambda: self._in_flight < self.inflight_limit)
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._slots:
+                self._in_flight -= 1
+                self._slots.notify_all()
+    
+    def record(self, latency: float, status: int):
+        """Registra uma resposta e ajusta o limite de concorrência"""
+        slow = False
+        if len(self.latencies) >= 10:
+            slow = latency > 2 * statistics.median(self.latencies)
+        self.latencies.append(latency)
+        
+        if status == 429 or slow:
+            # Recuo multiplicativo
+            self.consecutive_successes = 0
+            new_limit = max(self.min_limit, int(self.inflight_limit * 0.5))
+            if new_limit != self.inflight_limit:
+                logger.info(f"📉 Concorrência Steam reduzida: {self.inflight_limit} -> {new_limit}")
+                self._resize(new_limit)
+        else:
+            # Crescimento aditivo após sequência de sucessos
+            self.consecutive_successes += 1
+            if self.consecutive_successes >= self.increase_after and self.inflight_limit < self.max_limit:
+                self.consecutive_successes = 0
+                self._resize(self.inflight_limit + 1)
+    
+    def _resize(self, new_limit: int):
+        # Redução: quem já está em voo termina, mas ninguém novo entra até ficar abaixo do limite.
+        # Aumento: as vagas extras são ocupadas na próxima liberação (notify_all em use)
+        self.inflight_limit = new_limit
+
 class SteamOptimizedCollector:
     def __init__(self):
         self.session = None
         self.steam_market_base = "https://steamcommunity.com/market/priceoverview/"
+        # Query fixa pré-codificada; só market_hash_name varia por requisição
+        self.steam_market_url = yarl.URL(self.steam_market_base).with_query(appid='730', currency='1')  # CS2, USD
         
-        # Rate limiting otimizado
-        self.steam_requests = 0
-        self.last_steam_reset = time.time()
-        self.steam_delay = 0.8  # 75 requests/min (mais agressivo mas seguro)
+        # Rate limiting otimizado (token bucket)
+        self.steam_rate = 75 / 60  # 75 requests/min (mais agressivo mas seguro)
+        self.steam_burst = 5  # Capacidade do bucket
+        self.steam_tokens = float(self.steam_burst)
+        self.last_steam_refill = time.monotonic()
+        self.steam_limiter = AdaptiveConcurrencyLimiter(initial_limit=8)  # Requisições simultâneas ao Steam
+        
+        # Retentativas em 429 (backoff exponencial)
+        self.max_steam_retries = 5
+        self.max_backoff = 30
+        self.steam_retries = 0  # Por execução do coletor (não zera a cada chamada)
+        
+        # Cache em memória dos preços (evita repetir requisições entre estratégias)
+        self.price_cache_ttl = 300  # segundos
+        self.price_cache = {}  # market_hash_name -> (timestamp, resultado)
         
         # Lista expandida de skins populares
-        self.popular_skins = self._load_extended_skin_list()
+        self.popular_skins = POPULAR_SKINS
         
         # Estratégias de coleta
         self.collection_strategies = [
@@ -47,204 +331,115 @@ class SteamOptimizedCollector:
             'rarity_levels'       # Por nível de raridade
         ]
         
-    def _load_extended_skin_list(self) -> List[str]:
-        """Carrega lista estendida de skins"""
-        base_skins = [
-            # AK-47 Series
-            "AK-47 | Redline (Field-Tested)", "AK-47 | Redline (Minimal Wear)",
-            "AK-47 | Redline (Well-Worn)", "AK-47 | Redline (Battle-Scarred)",
-            "AK-47 | Redline (Factory New)", "AK-47 | Asiimov (Field-Tested)",
-            "AK-47 | Asiimov (Minimal Wear)", "AK-47 | Asiimov (Well-Worn)",
-            "AK-47 | Asiimov (Battle-Scarred)", "AK-47 | Asiimov (Factory New)",
-            
-            # M4A4 Series
-            "M4A4 | Desolate Space (Field-Tested)", "M4A4 | Desolate Space (Minimal Wear)",
-            "M4A4 | Desolate Space (Well-Worn)", "M4A4 | Desolate Space (Battle-Scarred)",
-            "M4A4 | Desolate Space (Factory New)", "M4A4 | Howl (Factory New)",
-            "M4A4 | Howl (Minimal Wear)", "M4A4 | Howl (Field-Tested)",
-            
-            # AWP Series
-            "AWP | Dragon Lore (Factory New)", "AWP | Dragon Lore (Minimal Wear)",
-            "AWP | Dragon Lore (Field-Tested)", "AWP | Dragon Lore (Well-Worn)",
-            "AWP | Dragon Lore (Battle-Scarred)", "AWP | Medusa (Factory New)",
-            "AWP | Medusa (Minimal Wear)", "AWP | Medusa (Field-Tested)",
-            
-            # M4A1-S Series
-            "M4A1-S | Hyper Beast (Field-Tested)", "M4A1-S | Hyper Beast (Minimal Wear)",
-            "M4A1-S | Hyper Beast (Well-Worn)", "M4A1-S | Hyper Beast (Battle-Scarred)",
-            "M4A1-S | Hyper Beast (Factory New)", "M4A1-S | Master Piece (Factory New)",
-            
-            # USP-S Series
-            "USP-S | Kill Confirmed (Field-Tested)", "USP-S | Kill Confirmed (Minimal Wear)",
-            "USP-S | Kill Confirmed (Well-Worn)", "USP-S | Kill Confirmed (Battle-Scarred)",
-            "USP-S | Kill Confirmed (Factory New)", "USP-S | Kill Confirmed (Minimal Wear)",
-            
-            # Glock Series
-            "Glock-18 | Water Elemental (Field-Tested)", "Glock-18 | Water Elemental (Minimal Wear)",
-            "Glock-18 | Water Elemental (Well-Worn)", "Glock-18 | Water Elemental (Battle-Scarred)",
-            "Glock-18 | Water Elemental (Factory New)", "Glock-18 | Fade (Factory New)",
-            
-            # Desert Eagle Series
-            "Desert Eagle | Golden Koi (Field-Tested)", "Desert Eagle | Golden Koi (Minimal Wear)",
-            "Desert Eagle | Golden Koi (Well-Worn)", "Desert Eagle | Golden Koi (Battle-Scarred)",
-            "Desert Eagle | Golden Koi (Factory New)", "Desert Eagle | Blaze (Factory New)",
-            
-            # Knife Series
-            "Karambit | Fade (Factory New)", "Karambit | Fade (Minimal Wear)",
-            "Karambit | Fade (Field-Tested)", "Karambit | Fade (Well-Worn)",
-            "Karambit | Fade (Battle-Scarred)", "Karambit | Marble Fade (Factory New)",
-            "M9 Bayonet | Marble Fade (Factory New)", "M9 Bayonet | Marble Fade (Minimal Wear)",
-            "Butterfly Knife | Fade (Factory New)", "Butterfly Knife | Fade (Minimal Wear)",
-            
-            # Hand Wraps Series
-            "★ Hand Wraps | CAUTION! (Field-Tested)", "★ Hand Wraps | CAUTION! (Minimal Wear)",
-            "★ Hand Wraps | CAUTION! (Well-Worn)", "★ Hand Wraps | CAUTION! (Battle-Scarred)",
-            "★ Hand Wraps | CAUTION! (Factory New)", "★ Hand Wraps | Desert Shamagh (Field-Tested)",
-            "★ Hand Wraps | Desert Shamagh (Minimal Wear)", "★ Hand Wraps | Desert Shamagh (Well-Worn)",
-            "★ Hand Wraps | Desert Shamagh (Battle-Scarred)", "★ Hand Wraps | Desert Shamagh (Factory New)",
-            
-            # Specialist Gloves Series
-            "★ Specialist Gloves | Crimson Kimono (Field-Tested)", "★ Specialist Gloves | Crimson Kimono (Minimal Wear)",
-            "★ Specialist Gloves | Crimson Kimono (Well-Worn)", "★ Specialist Gloves | Crimson Kimono (Battle-Scarred)",
-            "★ Specialist Gloves | Crimson Kimono (Factory New)", "★ Specialist Gloves | Emerald Web (Field-Tested)",
-            
-            # Driver Gloves Series
-            "★ Driver Gloves | Crimson Weave (Field-Tested)", "★ Driver Gloves | Crimson Weave (Minimal Wear)",
-            "★ Driver Gloves | Crimson Weave (Well-Worn)", "★ Driver Gloves | Crimson Weave (Battle-Scarred)",
-            "★ Driver Gloves | Crimson Weave (Factory New)", "★ Driver Gloves | Lunar Weave (Field-Tested)",
-            
-            # Sport Gloves Series
-            "★ Sport Gloves | Vice (Field-Tested)", "★ Sport Gloves | Vice (Minimal Wear)",
-            "★ Sport Gloves | Vice (Well-Worn)", "★ Sport Gloves | Vice (Battle-Scarred)",
-            "★ Sport Gloves | Vice (Factory New)", "★ Sport Gloves | Pandora's Box (Field-Tested)"
-        ]
-        
-        # Adicionar variações de wear para mais skins
-        extended_skins = base_skins.copy()
-        
-        # Adicionar mais variações
-        additional_skins = [
-            "AK-47 | Bloodsport (Field-Tested)", "AK-47 | Bloodsport (Minimal Wear)",
-            "AK-47 | Bloodsport (Well-Worn)", "AK-47 | Bloodsport (Battle-Scarred)",
-            "AK-47 | Bloodsport (Factory New)", "AK-47 | Fire Serpent (Field-Tested)",
-            "AK-47 | Fire Serpent (Minimal Wear)", "AK-47 | Fire Serpent (Well-Worn)",
-            "AK-47 | Fire Serpent (Battle-Scarred)", "AK-47 | Fire Serpent (Factory New)",
-            
-            "M4A4 | Evil Daimyo (Field-Tested)", "M4A4 | Evil Daimyo (Minimal Wear)",
-            "M4A4 | Evil Daimyo (Well-Worn)", "M4A4 | Evil Daimyo (Battle-Scarred)",
-            "M4A4 | Evil Daimyo (Factory New)", "M4A4 | Royal Paladin (Field-Tested)",
-            
-            "AWP | Lightning Strike (Factory New)", "AWP | Lightning Strike (Minimal Wear)",
-            "AWP | Lightning Strike (Field-Tested)", "AWP | Lightning Strike (Well-Worn)",
-            "AWP | Lightning Strike (Battle-Scarred)", "AWP | Graphite (Field-Tested)",
-            
-            "M4A1-S | Cyrex (Field-Tested)", "M4A1-S | Cyrex (Minimal Wear)",
-            "M4A1-S | Cyrex (Well-Worn)", "M4A1-S | Cyrex (Battle-Scarred)",
-            "M4A1-S | Cyrex (Factory New)", "M4A1-S | Golden Coil (Field-Tested)",
-            
-            "USP-S | Caiman (Field-Tested)", "USP-S | Caiman (Minimal Wear)",
-            "USP-S | Caiman (Well-Worn)", "USP-S | Caiman (Battle-Scarred)",
-            "USP-S | Caiman (Factory New)", "USP-S | Road Rash (Field-Tested)",
-            
-            "Glock-18 | Twilight Galaxy (Field-Tested)", "Glock-18 | Twilight Galaxy (Minimal Wear)",
-            "Glock-18 | Twilight Galaxy (Well-Worn)", "Glock-18 | Twilight Galaxy (Battle-Scarred)",
-            "Glock-18 | Twilight Galaxy (Factory New)", "Glock-18 | Candy Apple (Field-Tested)",
-            
-            "Desert Eagle | Sunset Storm (Field-Tested)", "Desert Eagle | Sunset Storm (Minimal Wear)",
-            "Desert Eagle | Sunset Storm (Well-Worn)", "Desert Eagle | Sunset Storm (Battle-Scarred)",
-            "Desert Eagle | Sunset Storm (Factory New)", "Desert Eagle | Hypnotic (Field-Tested)"
-        ]
-        
-        extended_skins.extend(additional_skins)
-        return extended_skins
-        
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={
-                'User-Agent': 'Skinlytics/2.0 (Portfolio Project)',
-                'Accept': 'application/json'
-            }
-        )
+        self.session = await get_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # A sessão é compartilhada; use close_session() no encerramento
+        self.session = None
     
     async def _respect_steam_rate_limit(self):
-        """Respeita rate limit do Steam Market de forma inteligente"""
-        current_time = time.time()
+        """Respeita rate limit do Steam Market com token bucket"""
+        current_time = time.monotonic()
         
-        # Reset contador a cada minuto
-        if current_time - self.last_steam_reset >= 60:
-            self.steam_requests = 0
-            self.last_steam_reset = current_time
+        # Reabastece tokens proporcionalmente ao tempo decorrido
+        elapsed = current_time - self.last_steam_refill
+        self.steam_tokens = min(self.steam_burst, self.steam_tokens + elapsed * self.steam_rate)
+        self.last_steam_refill = current_time
         
-        # Aguarda se necessário
-        if self.steam_requests >= 75:  # 75 requests/min (otimizado)
-            wait_time = 60 - (current_time - self.last_steam_reset)
-            if wait_time > 0:
-                logger.info(f"Rate limit Steam atingido. Aguardando {wait_time:.1f}s")
-                await asyncio.sleep(wait_time)
-                self.steam_requests = 0
-                self.last_steam_reset = current_time
+        # Reserva o token antes de aguardar; sem await entre leitura e escrita,
+        # chamadas concorrentes enfileiram corretamente sem precisar de lock
+        self.steam_tokens -= 1
+        if self.steam_tokens < 0:
+            # Bucket vazio: aguarda o reabastecimento com variação para evitar detecção
+            wait_time = -self.steam_tokens / self.steam_rate + random.uniform(0.1, 0.3)
+            await asyncio.sleep(wait_time)
+    
+    async def _fetch_steam_price(self, market_hash_name: str, attempt: int = 0) -> Optional[Dict]:
+        """Busca o preço de uma skin, com nova tentativa em backoff exponencial após 429"""
+        rate_limited = False
+        retry_after = None
         
-        self.steam_requests += 1
+        async with self.steam_limiter.use():
+            await self._respect_steam_rate_limit()
+            
+            url = self.steam_market_url.update_query(market_hash_name=market_hash_name)
+            
+            start_time = time.monotonic()
+            async with self.session.get(url) as response:
+                self.steam_limiter.record(time.monotonic() - start_time, response.status)
+                
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads if ORJSON_AVAILABLE else json.loads)
+                    if data.get('success'):
+                        return {
+                            'source': 'steam_market',
+                            'data': data,
+                            'timestamp': datetime.now().isoformat()
+                        }
+                    logger.warning(f"   ⚠️ Steam Market error for {market_hash_name}: {data}")
+                elif response.status == 429:
+                    rate_limited = True
+                    retry_after = response.headers.get('Retry-After')
+                else:
+                    logger.warning(f"   ❌ Steam Market HTTP {response.status} for {market_hash_name}")
         
-        # Delay variável para evitar detecção
-        base_delay = self.steam_delay
-        random_variation = random.uniform(0.1, 0.3)
-        actual_delay = base_delay + random_variation
+        if not rate_limited:
+            return None
         
-        await asyncio.sleep(actual_delay)
+        if attempt >= self.max_steam_retries:
+            logger.warning(f"   ❌ Rate limit (429) persistente para {market_hash_name}, desistindo após {attempt} tentativas")
+            return None
+        
+        # Aguarda fora do limitador para não ocupar uma vaga durante o backoff
+        delay = min(2 ** attempt, self.max_backoff) + random.random()
+        try:
+            delay = max(delay, float(retry_after))
+        except (TypeError, ValueError):
+            pass
+        
+        self.steam_retries += 1
+        logger.warning(f"   ⚠️ Rate limit (429) para {market_hash_name}, nova tentativa em {delay:.1f}s ({attempt + 1}/{self.max_steam_retries})")
+        await asyncio.sleep(delay)
+        return await self._fetch_steam_price(market_hash_name, attempt + 1)
     
     async def get_steam_market_prices(self, market_hash_names: List[str]) -> Dict:
         """Coleta preços do Steam Market com estratégia otimizada"""
         results = {}
         
-        logger.info(f"🎮 Coletando preços de {len(market_hash_names)} skins do Steam Market...")
+        # Reaproveitar preços ainda válidos no cache
+        now = time.monotonic()
+        for market_hash_name in market_hash_names:
+            cached = self.price_cache.get(market_hash_name)
+            if cached and now - cached[0] < self.price_cache_ttl:
+                results[market_hash_name] = cached[1]
+        pending = [name for name in dict.fromkeys(market_hash_names) if name not in results]
+        
+        if results:
+            logger.info(f"♻️ {len(results)} skins reaproveitadas do cache")
+        logger.info(f"🎮 Coletando preços de {len(pending)} skins do Steam Market...")
         
         # Dividir em lotes para melhor controle
         batch_size = 25
-        batches = [market_hash_names[i:i + batch_size] for i in range(0, len(market_hash_names), batch_size)]
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
         
         for batch_num, batch in enumerate(batches):
             logger.info(f"📦 Processando lote {batch_num + 1}/{len(batches)} ({len(batch)} skins)")
             
+            responses = await asyncio.gather(
+                *(self._fetch_steam_price(market_hash_name) for market_hash_name in batch),
+                return_exceptions=True
+            )
+            
             batch_results = {}
-            for i, market_hash_name in enumerate(batch):
-                try:
-                    await self._respect_steam_rate_limit()
-                    
-                    params = {
-                        'appid': '730',  # CS2
-                        'currency': '1',  # USD
-                        'market_hash_name': market_hash_name
-                    }
-                    
-                    async with self.session.get(self.steam_market_base, params=params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            if data.get('success'):
-                                batch_results[market_hash_name] = {
-                                    'source': 'steam_market',
-                                    'data': data,
-                                    'timestamp': datetime.now().isoformat()
-                                }
-                                logger.info(f"   ✅ {i+1}/{len(batch)}: {market_hash_name[:30]}... - ${data.get('median_price', 'N/A')}")
-                            else:
-                                logger.warning(f"   ⚠️ Steam Market error for {market_hash_name}: {data}")
-                        elif response.status == 429:
-                            logger.warning(f"   ⚠️ Rate limit (429) para {market_hash_name}, aguardando...")
-                            await asyncio.sleep(5)  # Aguardar mais tempo
-                            continue
-                        else:
-                            logger.warning(f"   ❌ Steam Market HTTP {response.status} for {market_hash_name}")
-                            
-                except Exception as e:
-                    logger.error(f"   ❌ Erro ao coletar {market_hash_name}: {e}")
-                    continue
+            for i, (market_hash_name, result) in enumerate(zip(batch, responses)):
+                if isinstance(result, Exception):
+                    logger.error(f"   ❌ Erro ao coletar {market_hash_name}: {result}")
+                elif result:
+                    batch_results[market_hash_name] = result
+                    self.price_cache[market_hash_name] = (time.monotonic(), result)
+                    logger.info(f"   ✅ {i+1}/{len(batch)}: {market_hash_name[:30]}... - ${result['data'].get('median_price', 'N/A')}")
             
             # Aguardar entre lotes
             if batch_num < len(batches) - 1:
@@ -254,21 +449,26 @@ class SteamOptimizedCollector:
             results.update(batch_results)
         
         logger.info(f"🎯 Steam Market: {len(results)} skins coletadas com sucesso")
-        return results
+        # Manter a ordem da lista solicitada
+        return {name: results[name] for name in market_hash_names if name in results}
     
-    def load_skins_from_csv(self, csv_file: str = "data/skins_list_en.csv") -> List[str]:
+    def load_skins_from_csv(self, csv_file: str = "data/skins_list_en.csv", limit: int = 200) -> List[str]:
         """Carrega lista de skins do arquivo CSV existente"""
         try:
             if os.path.exists(csv_file):
-                skins = []
-                with open(csv_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if 'market_hash_name' in row and row['market_hash_name']:
-                            skins.append(row['market_hash_name'])
+                with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+                    reader = csv.reader(f)
+                    header = next(reader, [])
+                    if 'market_hash_name' not in header:
+                        logger.warning(f"📋 Coluna market_hash_name ausente em {csv_file}")
+                        return []
+                    
+                    # Resolve a coluna uma vez e para de ler ao atingir o limite
+                    idx = header.index('market_hash_name')
+                    skins = list(islice((row[idx] for row in reader if len(row) > idx and row[idx]), limit))
                 
                 logger.info(f"📋 CSV carregado: {len(skins)} skins encontradas")
-                return skins[:200]  # Limitar a 200 para teste
+                return skins
             else:
                 logger.warning(f"📋 Arquivo CSV não encontrado: {csv_file}")
                 return []
@@ -278,20 +478,11 @@ class SteamOptimizedCollector:
     
     def get_optimized_skin_list(self, strategy: str = 'popular_skins', count: int = 100) -> List[str]:
         """Retorna lista de skins baseada na estratégia escolhida"""
-        if strategy == 'popular_skins':
-            return self.popular_skins[:count]
-        elif strategy == 'weapon_categories':
-            # Filtrar por categoria de arma
-            weapon_skins = [skin for skin in self.popular_skins if any(weapon in skin for weapon in ['AK-47', 'M4A4', 'AWP', 'M4A1-S'])]
-            return weapon_skins[:count]
-        elif strategy == 'price_ranges':
-            # Skins que provavelmente têm preços variados
-            return self.popular_skins[:count]
-        elif strategy == 'rarity_levels':
-            # Skins com diferentes níveis de raridade
-            return self.popular_skins[:count]
-        else:
-            return self.popular_skins[:count]
+        if strategy == 'weapon_categories':
+            # Filtrar por categoria de arma (pré-computado)
+            return list(WEAPON_CATEGORY_SKINS[:count])
+        # popular_skins, price_ranges e rarity_levels usam a lista completa
+        return list(self.popular_skins[:count])
     
     async def collect_all_data(self, strategy: str = 'popular_skins', max_skins: int = 100) -> Dict:
         """Coleta dados usando estratégia otimizada"""
@@ -316,12 +507,13 @@ class SteamOptimizedCollector:
                 'collection_timestamp': datetime.now().isoformat(),
                 'strategy_used': strategy,
                 'sources': ['steam_market'],
-                'success_rate': f"{(len(steam_data) / len(test_skins) * 100):.1f}%"
+                'success_rate': f"{(len(steam_data) / len(test_skins) * 100):.1f}%",
+                'retries': self.steam_retries  # Acumulado na execução (inclui a pré-busca do main)
             },
             'skins': {},
             'steam_market': steam_data,
             'analysis': {
-                'price_distribution': self._analyze_price_distribution(steam_data),
+                'price_distribution': {},
                 'weapon_categories': self._analyze_weapon_categories(steam_data),
                 'wear_distribution': self._analyze_wear_distribution(steam_data)
             }
@@ -329,136 +521,93 @@ class SteamOptimizedCollector:
         
         # 4. Consolidar por skin
         for skin in test_skins:
+            skin_class = classify(skin)
             consolidated_data['skins'][skin] = {
                 'steam_market': steam_data.get(skin),
                 'best_price': None,
                 'price_info': {},
-                'category': self._categorize_skin(skin),
-                'estimated_rarity': self._estimate_rarity(skin)
+                'category': skin_class.category,
+                'wear': skin_class.wear,
+                'estimated_rarity': skin_class.rarity
             }
             
             # Extrair informações de preço
             if skin in steam_data:
                 steam_info = steam_data[skin]['data']
                 
-                # Converter preços para float
-                median_price = steam_info.get('median_price', '0')
-                lowest_price = steam_info.get('lowest_price', '0')
+                # Converter preços para float (uma única vez por skin)
+                median_float = parse_price(steam_info.get('median_price', '0'))
+                lowest_float = parse_price(steam_info.get('lowest_price', '0'))
                 
-                try:
-                    median_float = float(median_price.replace('$', '').replace(',', '')) if median_price != '0' else 0
-                    lowest_float = float(lowest_price.replace('$', '').replace(',', '')) if lowest_price != '0' else 0
-                    
-                    consolidated_data['skins'][skin]['price_info'] = {
-                        'median_price': median_float,
-                        'lowest_price': lowest_float,
-                        'volume': steam_info.get('volume', '0'),
-                        'success': steam_info.get('success', False)
+                consolidated_data['skins'][skin]['price_info'] = {
+                    'median_price': median_float,
+                    'lowest_price': lowest_float,
+                    'volume': steam_info.get('volume', '0'),
+                    'success': steam_info.get('success', False)
+                }
+                
+                # Definir melhor preço
+                if median_float > 0:
+                    consolidated_data['skins'][skin]['best_price'] = {
+                        'source': 'steam_market',
+                        'price': median_float,
+                        'type': 'median'
                     }
-                    
-                    # Definir melhor preço
-                    if median_float > 0:
-                        consolidated_data['skins'][skin]['best_price'] = {
-                            'source': 'steam_market',
-                            'price': median_float,
-                            'type': 'median'
-                        }
-                    elif lowest_float > 0:
-                        consolidated_data['skins'][skin]['best_price'] = {
-                            'source': 'steam_market',
-                            'price': lowest_float,
-                            'type': 'lowest'
-                        }
-                        
-                except ValueError:
-                    logger.warning(f"⚠️ Erro ao converter preços para {skin}")
-                    continue
+                elif lowest_float > 0:
+                    consolidated_data['skins'][skin]['best_price'] = {
+                        'source': 'steam_market',
+                        'price': lowest_float,
+                        'type': 'lowest'
+                    }
+        
+        # 5. Distribuição de preços a partir dos preços já convertidos
+        consolidated_data['analysis']['price_distribution'] = self._analyze_price_distribution(consolidated_data['skins'])
         
         logger.info(f"🎯 Coleta concluída! {len(consolidated_data['skins'])} skins processadas")
         return consolidated_data
     
-    def _analyze_price_distribution(self, steam_data: Dict) -> Dict:
-        """Analisa distribuição de preços"""
-        prices = []
-        for skin_data in steam_data.values():
-            if skin_data['data'].get('median_price'):
-                try:
-                    price = float(skin_data['data']['median_price'].replace('$', '').replace(',', ''))
-                    prices.append(price)
-                except:
-                    continue
-        
-        if not prices:
+    def _analyze_price_distribution(self, skins: Dict) -> Dict:
+        """Analisa distribuição de preços em uma única passada"""
+        total = 0
+        price_sum = 0.0
+        min_price = float('inf')
+        max_price = 0.0
+        buckets = [0, 0, 0, 0]  # low, medium, high, premium
+        
+        for skin_data in skins.values():
+            price = skin_data['price_info'].get('median_price')
+            if not price:
+                continue
+            total += 1
+            price_sum += price
+            min_price = min(min_price, price)
+            max_price = max(max_price, price)
+            buckets[0 if price < 10 else 1 if price < 100 else 2 if price < 1000 else 3] += 1
+        
+        if not total:
             return {}
         
         return {
-            'total_items': len(prices),
-            'average_price': sum(prices) / len(prices),
-            'min_price': min(prices),
-            'max_price': max(prices),
+            'total_items': total,
+            'average_price': price_sum / total,
+            'min_price': min_price,
+            'max_price': max_price,
             'price_ranges': {
-                'low': len([p for p in prices if p < 10]),
-                'medium': len([p for p in prices if 10 <= p < 100]),
-                'high': len([p for p in prices if 100 <= p < 1000]),
-                'premium': len([p for p in prices if p >= 1000])
+                'low': buckets[0],
+                'medium': buckets[1],
+                'high': buckets[2],
+                'premium': buckets[3]
             }
         }
     
     def _analyze_weapon_categories(self, steam_data: Dict) -> Dict:
         """Analisa distribuição por categoria de arma"""
-        categories = {}
-        for skin_name in steam_data.keys():
-            category = self._categorize_skin(skin_name)
-            categories[category] = categories.get(category, 0) + 1
-        
-        return categories
+        return dict(Counter(classify(skin_name).category for skin_name in steam_data))
     
     def _analyze_wear_distribution(self, steam_data: Dict) -> Dict:
         """Analisa distribuição por wear"""
-        wears = {}
-        for skin_name in steam_data.keys():
-            if 'Factory New' in skin_name:
-                wears['Factory New'] = wears.get('Factory New', 0) + 1
-            elif 'Minimal Wear' in skin_name:
-                wears['Minimal Wear'] = wears.get('Minimal Wear', 0) + 1
-            elif 'Field-Tested' in skin_name:
-                wears['Field-Tested'] = wears.get('Field-Tested', 0) + 1
-            elif 'Well-Worn' in skin_name:
-                wears['Well-Worn'] = wears.get('Well-Worn', 0) + 1
-            elif 'Battle-Scarred' in skin_name:
-                wears['Battle-Scarred'] = wears.get('Battle-Scarred', 0) + 1
-        
-        return wears
-    
-    def _categorize_skin(self, skin_name: str) -> str:
-        """Categoriza skin por tipo de arma"""
-        if 'AK-47' in skin_name:
-            return 'Rifle'
-        elif 'M4A4' in skin_name or 'M4A1-S' in skin_name:
-            return 'Rifle'
-        elif 'AWP' in skin_name:
-            return 'Sniper'
-        elif 'USP-S' in skin_name or 'Glock-18' in skin_name or 'Desert Eagle' in skin_name:
-            return 'Pistol'
-        elif 'Karambit' in skin_name or 'M9 Bayonet' in skin_name or 'Butterfly Knife' in skin_name:
-            return 'Knife'
-        elif 'Hand Wraps' in skin_name or 'Gloves' in skin_name:
-            return 'Gloves'
-        else:
-            return 'Other'
-    
-    def _estimate_rarity(self, skin_name: str) -> str:
-        """Estima raridade da skin"""
-        if 'Dragon Lore' in skin_name or 'Howl' in skin_name:
-            return 'Legendary'
-        elif 'Fade' in skin_name or 'Marble Fade' in skin_name:
-            return 'Epic'
-        elif 'Factory New' in skin_name:
-            return 'Rare'
-        elif 'Minimal Wear' in skin_name:
-            return 'Uncommon'
-        else:
-            return 'Common'
+        wears = (classify(skin_name).wear for skin_name in steam_data)
+        return dict(Counter(wear for wear in wears if wear))
     
     def save_data(self, data: Dict, filename: str = None) -> str:
         """Salva dados coletados"""
@@ -468,8 +617,12 @@ class SteamOptimizedCollector:
             filename = f"steam_optimized_{strategy}_{timestamp}.json"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
             logger.info(f"💾 Dados salvos em {filename}")
             return filename
         except Exception as e:
@@ -480,51 +633,60 @@ async def main():
     """Função principal para teste"""
     logger.info("🚀 Iniciando Steam Optimized Collector")
     
-    async with SteamOptimizedCollector() as collector:
-        # Testar diferentes estratégias
-        strategies = ['popular_skins', 'weapon_categories', 'price_ranges']
-        
-        for strategy in strategies:
-            logger.info(f"\n🎯 Testando estratégia: {strategy}")
+    try:
+        async with SteamOptimizedCollector() as collector:
+            # Testar diferentes estratégias
+            strategies = ['popular_skins', 'weapon_categories', 'price_ranges']
             
-            # Coletar dados
-            data = await collector.collect_all_data(strategy=strategy, max_skins=50)
+            # As estratégias compartilham a maior parte das skins: buscar a união
+            # uma única vez e deixar cada estratégia ler do cache
+            all_skins = list(dict.fromkeys(
+                skin for strategy in strategies for skin in collector.get_optimized_skin_list(strategy, 50)
+            ))
+            await collector.get_steam_market_prices(all_skins)
             
-            if data and data['skins']:
-                # Salvar dados
-                filename = collector.save_data(data)
-                
-                # Mostrar resumo
-                logger.info(f"📊 RESUMO DA COLETA ({strategy}):")
-                logger.info(f"   Total de skins: {data['metadata']['total_skins']}")
-                logger.info(f"   Steam Market: {data['metadata']['steam_count']}")
-                logger.info(f"   Taxa de sucesso: {data['metadata']['success_rate']}")
-                logger.info(f"   Arquivo salvo: {filename}")
+            for strategy in strategies:
+                logger.info(f"\n🎯 Testando estratégia: {strategy}")
                 
-                # Mostrar análise
-                if 'analysis' in data:
-                    analysis = data['analysis']
-                    logger.info(f"📈 ANÁLISE:")
-                    logger.info(f"   Distribuição de preços: {analysis.get('price_distribution', {}).get('total_items', 0)} itens")
-                    logger.info(f"   Categorias de armas: {analysis.get('weapon_categories', {})}")
-                    logger.info(f"   Distribuição de wear: {analysis.get('wear_distribution', {})}")
+                # Coletar dados
+                data = await collector.collect_all_data(strategy=strategy, max_skins=50)
                 
-                # Mostrar algumas skins com preços
-                logger.info(f"\n💰 EXEMPLOS DE PREÇOS ({strategy}):")
-                count = 0
-                for skin_name, skin_data in data['skins'].items():
-                    if count >= 3:  # Mostrar apenas 3 exemplos por estratégia
-                        break
-                    if skin_data['best_price']:
-                        logger.info(f"   {skin_name}: ${skin_data['best_price']['price']:.2f} ({skin_data['best_price']['source']})")
-                        count += 1
-                
-                # Aguardar entre estratégias
-                if strategy != strategies[-1]:
-                    logger.info(f"⏳ Aguardando 5s antes da próxima estratégia...")
-                    await asyncio.sleep(5)
-            else:
-                logger.error(f"❌ Falha na coleta com estratégia {strategy}")
+                if data and data['skins']:
+                    # Salvar dados
+                    filename = collector.save_data(data)
+                    
+                    # Mostrar resumo
+                    logger.info(f"📊 RESUMO DA COLETA ({strategy}):")
+                    logger.info(f"   Total de skins: {data['metadata']['total_skins']}")
+                    logger.info(f"   Steam Market: {data['metadata']['steam_count']}")
+                    logger.info(f"   Taxa de sucesso: {data['metadata']['success_rate']}")
+                    logger.info(f"   Retentativas (429) na execução: {data['metadata']['retries']}")
+                    logger.info(f"   Arquivo salvo: {filename}")
+                    
+                    # Mostrar análise
+                    if 'analysis' in data:
+                        analysis = data['analysis']
+                        logger.info(f"📈 ANÁLISE:")
+                        logger.info(f"   Distribuição de preços: {analysis.get('price_distribution', {}).get('total_items', 0)} itens")
+                        logger.info(f"   Categorias de armas: {analysis.get('weapon_categories', {})}")
+                        logger.info(f"   Distribuição de wear: {analysis.get('wear_distribution', {})}")
+                    
+                    # Mostrar algumas skins com preços
+                    logger.info(f"\n💰 EXEMPLOS DE PREÇOS ({strategy}):")
+                    count = 0
+                    for skin_name, skin_data in data['skins'].items():
+                        if count >= 3:  # Mostrar apenas 3 exemplos por estratégia
+                            break
+                        if skin_data['best_price']:
+                            logger.info(f"   {skin_name}: ${skin_data['best_price']['price']:.2f} ({skin_data['best_price']['source']})")
+                            count += 1
+                else:
+                    logger.error(f"❌ Falha na coleta com estratégia {strategy}")
+    finally:
+        await close_session()
 
 if __name__ == "__main__":
+    # uvloop reduz o overhead por requisição do event loop (precisa ser definido antes do asyncio.run)
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(main())
@@ -10,9 +10,14 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import numpy as np
 from datetime import datetime, timedelta
 import time
+from sqlalchemy import BigInteger, Float, case, cast, func, select, text
+
+from demo_data import configure_page, downsample_indices, fake_price_timeline, inject_css, render_sidebar_features
+
+# Copy-on-write: fatias dos DataFrames cacheados não copiam dados até serem modificadas
+pd.set_option("mode.copy_on_write", True)
 
 # Configuração otimizada para Railway (detecta automaticamente o plano)
 try:
@@ -40,82 +45,81 @@ except ImportError as e:
     st.info("Verificando configuração da aplicação...")
 
 # Configuração da página otimizada para Railway Free
-if 'RAILWAY_ENVIRONMENT' in os.environ:
-    st.set_page_config(
-        page_title="Skinlytics",
-        page_icon="🎯", 
-        layout="wide",
-        initial_sidebar_state="collapsed"  # Economizar memória no Railway
-    )
-else:
-    st.set_page_config(
-        page_title="Skinlytics - CS2 Trading Intelligence",
-        page_icon="🎯",
-        layout="wide", 
-        initial_sidebar_state="expanded"
-    )
+configure_page()
+inject_css()
+
+# Cache para melhor performance: cada consulta tem seu próprio TTL para que
+# uma métrica expirada não force o recarregamento de todo o payload
+def _time_bucket(seconds: int) -> int:
+    """Janela de tempo atual, usada como chave dos caches em disco (persist ignora ttl)"""
+    return int(time.time() // seconds)
+
+def _estimated_count(session, model) -> int:
+    """Estimativa do planner (pg_class.reltuples); COUNT(*) só fora do Postgres ou em tabela sem ANALYZE"""
+    if session.bind.dialect.name == 'postgresql':
+        estimate = session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+            {"table": model.__tablename__}
+        ).scalar()
+        if estimate and estimate > 0:
+            return estimate
+    return session.query(model).count()
+
+@st.cache_data(ttl=60)
+def _counts():
+    """Total de listings e de skins"""
+    with get_session() as session:
+        total_listings = _estimated_count(session, ListingOptimized)
+        total_skins = _estimated_count(session, OptimizedSkin)
+        return total_listings, total_skins
 
-# CSS customizado
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #FF6B35;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-        margin: 0.5rem 0;
-    }
-    .opportunity-card {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        color: white;
-        margin: 0.5rem 0;
-    }
-    .stTabs [data-baseweb="tab-list"] button [data-testid="stMarkdownContainer"] p {
-        font-size: 1.1rem;
-        font-weight: bold;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_data(ttl=60)
+def _value_sum():
+    """Soma dos preços em USD, calculada no banco"""
+    with get_session() as session:
+        # SUM(integer) no Postgres é numeric (Decimal no Python): o cast devolve um int
+        total_value = session.query(
+            cast(func.coalesce(func.sum(ListingOptimized.price), 0), BigInteger)
+        ).filter(ListingOptimized.price > 0).scalar()
+        return total_value / 100  # Convert to USD
+
+@st.cache_data(persist="disk", max_entries=4, show_spinner="Carregando mercado…")
+def _rarity_dist(bucket: int):
+    """Quantidade de listings por raridade"""
+    with get_session() as session:
+        query = select(
+            OptimizedSkin.rarity,
+            func.count(ListingOptimized.id).label('count')
+        ).join(ListingOptimized).group_by(OptimizedSkin.rarity)
+        return pd.read_sql(query, session.bind)
+
+@st.cache_data(ttl=120)
+def _recent_listings(limit: int = 20):
+    """Últimos listings coletados, lidos direto para um DataFrame"""
+    with get_session() as session:
+        query = select(
+            OptimizedSkin.market_hash_name,
+            (ListingOptimized.price / 100.0).label('price'),
+            ListingOptimized.float_value,
+            ListingOptimized.watchers,
+            ListingOptimized.collected_at
+        ).join(OptimizedSkin).order_by(
+            ListingOptimized.collected_at.desc()
+        ).limit(limit)
+        return pd.read_sql(query, session.bind)
+
+@st.cache_data(persist="disk", max_entries=4, show_spinner="Carregando oportunidades…")
+def _opportunities(bucket: int, limit: int = 20):
+    """Top oportunidades calculadas pelo agregador"""
+    aggregation_service = AggregationService()
+    return aggregation_service.get_top_opportunities(limit)
 
-# Cache para melhor performance
-@st.cache_data(ttl=300)  # 5 minutos de cache
 def load_market_data():
     """Carrega dados do mercado"""
-    session = get_session()
-    
     try:
         # Estatísticas gerais
-        total_listings = session.query(ListingOptimized).count()
-        total_skins = session.query(OptimizedSkin).count()
-        total_value = session.query(ListingOptimized.price).filter(ListingOptimized.price > 0).all()
-        total_value_sum = sum([l[0] for l in total_value if l[0]]) / 100  # Convert to USD
-        
-        # Últimos listings
-        recent_listings = session.query(ListingOptimized, OptimizedSkin).join(OptimizedSkin).order_by(
-            ListingOptimized.collected_at.desc()
-        ).limit(20).all()
-        
-        # Top oportunidades
-        aggregation_service = AggregationService()
-        opportunities = aggregation_service.get_top_opportunities(20)
-        
-        # Distribuição por raridade
-        rarity_dist = session.query(
-            OptimizedSkin.rarity, 
-            session.query(ListingOptimized).filter(ListingOptimized.skin_id == OptimizedSkin.id).count().label('count')
-        ).join(ListingOptimized).group_by(OptimizedSkin.rarity).all()
-        
-        session.close()
+        total_listings, total_skins = _counts()
+        total_value_sum = _value_sum()
         
         return {
             'stats': {
@@ -124,41 +128,34 @@ def load_market_data():
                 'total_value': total_value_sum,
                 'avg_price': total_value_sum / total_listings if total_listings > 0 else 0
             },
-            'recent_listings': recent_listings,
-            'opportunities': opportunities,
-            'rarity_dist': rarity_dist
+            'recent_listings': _recent_listings(20),
+            'opportunities': _opportunities(_time_bucket(300), 20),
+            'rarity_dist': _rarity_dist(_time_bucket(300))
         }
     except Exception as e:
         st.error(f"Erro ao carregar dados: {e}")
-        session.close()
         return None
 
-@st.cache_data(ttl=600)  # 10 minutos de cache
-def load_price_trends():
+@st.cache_data(persist="disk", max_entries=4, show_spinner="Carregando tendências…")
+def load_price_trends(bucket: int):
     """Carrega tendências de preços"""
-    session = get_session()
-    
     try:
-        # Top 10 skins por volume
-        top_skins = session.query(
+        # Top 10 skins por volume: um único GROUP BY (o avg ignora preços zerados)
+        volume = func.count(ListingOptimized.id)
+        query = select(
             OptimizedSkin.market_hash_name,
-            session.query(ListingOptimized.price).filter(
-                ListingOptimized.skin_id == OptimizedSkin.id
-            ).count().label('volume'),
-            session.query(ListingOptimized.price).filter(
-                ListingOptimized.skin_id == OptimizedSkin.id,
-                ListingOptimized.price > 0
-            ).func.avg().label('avg_price')
+            volume.label('volume'),
+            # AVG(integer) vira numeric/Decimal (coluna object no pandas); o cast mantém float64
+            (cast(func.avg(case((ListingOptimized.price > 0, ListingOptimized.price))), Float) / 100).label('avg_price')
         ).join(ListingOptimized).group_by(
             OptimizedSkin.id, OptimizedSkin.market_hash_name
-        ).order_by('volume desc').limit(10).all()
+        ).order_by(volume.desc()).limit(10)
         
-        session.close()
-        return top_skins
+        with get_session() as session:
+            return pd.read_sql(query, session.bind)
     except Exception as e:
         st.error(f"Erro ao carregar tendências: {e}")
-        session.close()
-        return []
+        return pd.DataFrame(columns=['market_hash_name', 'volume', 'avg_price'])
 
 def show_railway_stats():
     """Mostra estatísticas de uso do Railway (Free ou Hobby Plan)"""
@@ -206,72 +203,112 @@ def show_railway_stats():
         except Exception:
             pass
 
-def main():
-    """Função principal do dashboard"""
-    
-    # Header
-    st.markdown('<h1 class="main-header">🎯 SKINLYTICS</h1>', unsafe_allow_html=True)
-    st.markdown('<p style="text-align: center; font-size: 1.2rem; color: #666;">CS2 Skin Trading Intelligence Platform</p>', unsafe_allow_html=True)
-    
-    # Mostrar stats do Railway se estiver em produção
-    show_railway_stats()
-    
-    # Sidebar
-    with st.sidebar:
-        st.image("https://via.placeholder.com/200x100/FF6B35/FFFFFF?text=SKINLYTICS", width=200)
-        st.markdown("### 🚀 Features")
-        st.markdown("- 📊 Dados em tempo real")
-        st.markdown("- 🎯 Oportunidades de trading")
-        st.markdown("- 📈 Análise de tendências")
-        st.markdown("- 🔍 Filtros avançados")
-        
-        st.markdown("### ⚙️ Configurações")
-        auto_refresh = st.checkbox("Auto-refresh (30s)", value=False)
-        show_debug = st.checkbox("Mostrar debug", value=False)
-        
-        if auto_refresh:
-            time.sleep(30)
-            st.rerun()
+def render_metrics():
+    """Métricas principais, lidas direto dos caches de contagem/soma"""
+    total_listings, total_skins = _counts()
+    total_value = _value_sum()
+    avg_price = total_value / total_listings if total_listings > 0 else 0
     
-    # Carregar dados
-    with st.spinner("🔄 Carregando dados do mercado..."):
-        market_data = load_market_data()
-        price_trends = load_price_trends()
-    
-    if not market_data:
-        st.error("❌ Não foi possível carregar os dados. Verifique se o collector está rodando.")
-        return
-    
-    # Métricas principais
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric(
             label="📦 Total Listings",
-            value=f"{market_data['stats']['total_listings']:,}",
+            value=f"{total_listings:,}",
             delta="Em tempo real"
         )
     
     with col2:
         st.metric(
             label="🎨 Skins Únicas",
-            value=f"{market_data['stats']['total_skins']:,}",
+            value=f"{total_skins:,}",
             delta="Crescendo"
         )
     
     with col3:
         st.metric(
             label="💰 Valor Total",
-            value=f"${market_data['stats']['total_value']:,.2f}",
+            value=f"${total_value:,.2f}",
             delta="USD"
         )
     
     with col4:
         st.metric(
             label="📊 Preço Médio",
-            value=f"${market_data['stats']['avg_price']:.2f}",
+            value=f"${avg_price:.2f}",
             delta="Por item"
         )
+
+def _trend_color(value) -> str:
+    """Cor da tendência: verde sobe, vermelho cai"""
+    return f"color: {'green' if value > 0 else 'red' if value < 0 else 'gray'}"
+
+@st.fragment
+def render_opportunities(opportunities):
+    """Filtros + lista de oportunidades; mexer nos filtros reexecuta só este fragmento"""
+    # Filtros
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        min_score = st.slider("Score Mínimo", 0, 100, 60)
+    with col2:
+        max_price = st.slider("Preço Máximo ($)", 0, 1000, 500)
+    with col3:
+        stattrak_only = st.checkbox("Apenas StatTrak™")
+    
+    # Filtrar oportunidades
+    opps_df = pd.DataFrame(opportunities)
+    mask = (opps_df['opportunity_score'] >= min_score) & (opps_df['current_price'] <= max_price)
+    if stattrak_only:
+        mask &= opps_df['is_stattrak']
+    top_ops = opps_df[mask].head(10)
+    top_ops = top_ops.assign(
+        badges=top_ops['is_stattrak'].map({True: "🔥", False: ""}) + top_ops['is_undervalued'].map({True: "💎", False: ""})
+    )
+    
+    # Mostrar oportunidades: uma única tabela em vez de colunas/métricas por linha
+    st.dataframe(
+        top_ops.style.map(_trend_color, subset=['trend_7d']),
+        column_order=['skin_name', 'badges', 'current_price', 'trend_7d', 'opportunity_score'],
+        column_config={
+            'skin_name': st.column_config.TextColumn("Skin"),
+            'badges': st.column_config.TextColumn(""),
+            'current_price': st.column_config.NumberColumn("Preço", format="$%.2f"),
+            'trend_7d': st.column_config.NumberColumn("Tendência 7d", format="%+.1f%%"),
+            'opportunity_score': st.column_config.ProgressColumn("Score", min_value=0, max_value=100, format="%.0f")
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+
+def main():
+    """Função principal do dashboard"""
+    
+    # Header
+    st.markdown('<h1 class="main-header">🎯 SKINLYTICS</h1>', unsafe_allow_html=True)
+    st.markdown('<p style="text-align: center; font-size: 1.2rem; color: #666;">CS2 Skin Trading Intelligence Platform</p>', unsafe_allow_html=True)
+    
+    # Mostrar stats do Railway se estiver em produção
+    show_railway_stats()
+    
+    # Sidebar
+    with st.sidebar:
+        render_sidebar_features()
+        
+        st.markdown("### ⚙️ Configurações")
+        auto_refresh = st.checkbox("Auto-refresh (30s)", value=False)
+        show_debug = st.checkbox("Mostrar debug", value=False)
+    
+    # Carregar dados
+    with st.spinner("🔄 Carregando dados do mercado..."):
+        market_data = load_market_data()
+        price_trends = load_price_trends(_time_bucket(600))  # 10 minutos de cache
+    
+    if not market_data:
+        st.error("❌ Não foi possível carregar os dados. Verifique se o collector está rodando.")
+        return
+    
+    # Métricas principais (fragmento: o auto-refresh reexecuta só este bloco)
+    st.fragment(render_metrics, run_every=30 if auto_refresh else None)()
     
     # Tabs principais
     tab1, tab2, tab3, tab4 = st.tabs(["🎯 Oportunidades", "📊 Mercado", "📈 Tendências", "🔍 Explorer"])
@@ -280,44 +317,7 @@ def main():
         st.subheader("🏆 Top Oportunidades de Trading")
         
         if market_data['opportunities']:
-            # Filtros
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                min_score = st.slider("Score Mínimo", 0, 100, 60)
-            with col2:
-                max_price = st.slider("Preço Máximo ($)", 0, 1000, 500)
-            with col3:
-                stattrak_only = st.checkbox("Apenas StatTrak™")
-            
-            # Filtrar oportunidades
-            filtered_ops = [
-                op for op in market_data['opportunities']
-                if op['opportunity_score'] >= min_score
-                and op['current_price'] <= max_price
-                and (not stattrak_only or op['is_stattrak'])
-            ]
-            
-            # Mostrar oportunidades
-            for i, opp in enumerate(filtered_ops[:10], 1):
-                col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-                
-                with col1:
-                    stattrak_badge = "🔥" if opp['is_stattrak'] else ""
-                    undervalued_badge = "💎" if opp['is_undervalued'] else ""
-                    st.write(f"**{i}. {opp['skin_name'][:50]}** {stattrak_badge}{undervalued_badge}")
-                
-                with col2:
-                    st.metric("Preço", f"${opp['current_price']:.2f}")
-                
-                with col3:
-                    trend_color = "green" if opp['trend_7d'] > 0 else "red" if opp['trend_7d'] < 0 else "gray"
-                    st.markdown(f"<span style='color:{trend_color}'>{opp['trend_7d']:+.1f}%</span>", unsafe_allow_html=True)
-                
-                with col4:
-                    score_color = "green" if opp['opportunity_score'] > 80 else "orange" if opp['opportunity_score'] > 60 else "red"
-                    st.markdown(f"<span style='color:{score_color};font-weight:bold'>{opp['opportunity_score']:.0f}</span>", unsafe_allow_html=True)
-                
-                st.divider()
+            render_opportunities(market_data['opportunities'])
         else:
             st.info("🔄 Carregando oportunidades... Execute o agregador para calcular scores.")
     
@@ -325,14 +325,15 @@ def main():
         st.subheader("📊 Visão Geral do Mercado")
         
         # Gráfico de distribuição por raridade
-        if market_data['rarity_dist']:
+        rarity_dist = market_data['rarity_dist']
+        if not rarity_dist.empty:
             rarity_names = {0: "Consumer", 1: "Industrial", 2: "Mil-Spec", 3: "Restricted", 
                           4: "Classified", 5: "Covert", 6: "Contraband", 7: "★ Knife"}
             
-            rarity_df = pd.DataFrame([
-                {'Raridade': rarity_names.get(r[0], f"Rarity {r[0]}"), 'Quantidade': r[1]}
-                for r in market_data['rarity_dist']
-            ])
+            rarity_df = pd.DataFrame({
+                'Raridade': rarity_dist['rarity'].map(rarity_names).fillna("Rarity " + rarity_dist['rarity'].astype(str)),
+                'Quantidade': rarity_dist['count']
+            })
             
             col1, col2 = st.columns(2)
             
@@ -359,31 +360,30 @@ def main():
         
         # Últimos listings
         st.subheader("⏰ Últimos Listings")
-        if market_data['recent_listings']:
-            recent_df = pd.DataFrame([
-                {
-                    'Skin': listing.market_hash_name[:40],
-                    'Preço': f"${listing_obj.price/100:.2f}",
-                    'Float': f"{listing_obj.float_value:.4f}" if listing_obj.float_value else "N/A",
-                    'Watchers': listing_obj.watchers or 0,
-                    'Coletado': listing_obj.collected_at.strftime("%H:%M:%S")
-                }
-                for listing_obj, listing in market_data['recent_listings']
-            ])
-            st.dataframe(recent_df, use_container_width=True)
+        recent_df = market_data['recent_listings']
+        if not recent_df.empty:
+            st.dataframe(
+                recent_df,
+                column_config={
+                    'market_hash_name': st.column_config.TextColumn("Skin"),
+                    'price': st.column_config.NumberColumn("Preço", format="$%.2f"),
+                    'float_value': st.column_config.NumberColumn("Float", format="%.4f"),
+                    'watchers': st.column_config.NumberColumn("Watchers"),
+                    'collected_at': st.column_config.DatetimeColumn("Coletado", format="HH:mm:ss")
+                },
+                hide_index=True,
+                use_container_width=True
+            )
     
     with tab3:
         st.subheader("📈 Tendências de Preços")
         
-        if price_trends:
-            trend_df = pd.DataFrame([
-                {
-                    'Skin': trend[0][:30],
-                    'Volume': trend[1],
-                    'Preço Médio': f"${trend[2]/100:.2f}" if trend[2] else "$0.00"
-                }
-                for trend in price_trends
-            ])
+        if not price_trends.empty:
+            trend_df = pd.DataFrame({
+                'Skin': price_trends['market_hash_name'].str[:30],
+                'Volume': price_trends['volume'],
+                'Preço Médio': price_trends['avg_price'].fillna(0)
+            })
             
             col1, col2 = st.columns(2)
             
@@ -402,17 +402,24 @@ def main():
             
             with col2:
                 st.subheader("📊 Detalhes")
-                st.dataframe(trend_df, use_container_width=True)
+                st.dataframe(
+                    trend_df,
+                    column_config={'Preço Médio': st.column_config.NumberColumn(format="$%.2f")},
+                    use_container_width=True
+                )
         
         # Simulação de gráfico temporal (para futuras implementações)
         st.subheader("📊 Preços Históricos (Simulação)")
-        dates = pd.date_range(start='2025-01-01', end='2025-08-06', freq='D')
-        fake_prices = np.random.normal(100, 20, len(dates)).cumsum()
+        timeline = fake_price_timeline()
+        dates = timeline.index.to_numpy()
+        fake_prices = timeline['Preço'].to_numpy()
+        
+        idx = downsample_indices(dates, fake_prices)
         
         fig_timeline = go.Figure()
-        fig_timeline.add_trace(go.Scatter(
-            x=dates,
-            y=fake_prices,
+        fig_timeline.add_trace(go.Scattergl(
+            x=dates[idx],
+            y=fake_prices[idx],
             mode='lines',
             name='AK-47 | Redline (FT)',
             line=dict(color='#FF6B35', width=2)
@@ -439,36 +446,41 @@ def main():
         
         # Busca em tempo real
         if search_term:
-            session = get_session()
             try:
-                results = session.query(ListingOptimized, OptimizedSkin).join(OptimizedSkin).filter(
+                query = select(
+                    OptimizedSkin.market_hash_name,
+                    (ListingOptimized.price / 100.0).label('price'),
+                    ListingOptimized.float_value,
+                    OptimizedSkin.rarity,
+                    OptimizedSkin.is_stattrak,
+                    ListingOptimized.watchers
+                ).join(OptimizedSkin).where(
                     OptimizedSkin.market_hash_name.ilike(f'%{search_term}%'),
                     ListingOptimized.price >= price_range[0] * 100,
                     ListingOptimized.price <= price_range[1] * 100
-                ).limit(50).all()
+                ).limit(50)
+                with get_session() as session:
+                    results_df = pd.read_sql(query, session.bind)
                 
-                if results:
-                    results_df = pd.DataFrame([
-                        {
-                            'Skin': skin.market_hash_name,
-                            'Preço': f"${listing.price/100:.2f}",
-                            'Float': f"{listing.float_value:.6f}" if listing.float_value else "N/A",
-                            'Raridade': skin.rarity,
-                            'StatTrak': "🔥" if skin.is_stattrak else "",
-                            'Watchers': listing.watchers or 0
-                        }
-                        for listing, skin in results
-                    ])
-                    
-                    st.dataframe(results_df, use_container_width=True)
-                    st.success(f"✅ Encontrados {len(results)} resultados para '{search_term}'")
+                if not results_df.empty:
+                    st.dataframe(
+                        results_df,
+                        column_config={
+                            'market_hash_name': st.column_config.TextColumn("Skin"),
+                            'price': st.column_config.NumberColumn("Preço", format="$%.2f"),
+                            'float_value': st.column_config.NumberColumn("Float", format="%.6f"),
+                            'rarity': st.column_config.TextColumn("Raridade"),
+                            'is_stattrak': st.column_config.CheckboxColumn("StatTrak"),
+                            'watchers': st.column_config.NumberColumn("Watchers")
+                        },
+                        hide_index=True,
+                        use_container_width=True
+                    )
+                    st.success(f"✅ Encontrados {len(results_df)} resultados para '{search_term}'")
                 else:
                     st.warning(f"❌ Nenhum resultado encontrado para '{search_term}'")
-                
-                session.close()
             except Exception as e:
                 st.error(f"Erro na busca: {e}")
-                session.close()
     
     # Footer
     st.divider()
@@ -7,15 +7,20 @@ Dashboard com dados reais do PostgreSQL
 import os
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 from datetime import datetime, timedelta
-import time
-import psycopg2
-from sqlalchemy import create_engine, text
-import json
+from typing import TYPE_CHECKING
+from sqlalchemy import Integer, String, bindparam, create_engine, text
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Auto-refresh disparado pelo navegador (pip install streamlit-autorefresh)
+try:
+    from streamlit_autorefresh import st_autorefresh
+    AUTOREFRESH_AVAILABLE = True
+except ImportError:
+    AUTOREFRESH_AVAILABLE = False
 
 # Configuração da página
 st.set_page_config(
@@ -56,27 +61,133 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Nomes das raridades, indexados pelo código salvo em skins_optimized.rarity
+_RARITY_LEVELS = ["Consumer", "Industrial", "Mil-Spec", "Restricted", "Classified", "Covert", "Contraband", "★ Knife"]
+
+# Resultados por página no Explorer
+SEARCH_PAGE_SIZE = 50
+
+# Busca do Explorer: construída uma vez para reaproveitar o cache de compilação do SQLAlchemy
+_SEARCH_STMT = text("""
+    SELECT s.market_hash_name, CAST(l.price AS DOUBLE PRECISION) / 100 AS price_usd,
+           l.float_value, s.rarity, l.watchers
+    FROM skins_optimized s
+    JOIN listings_optimized l ON s.id = l.skin_id
+    WHERE s.market_hash_name ILIKE :search
+    AND l.price >= :min_price AND l.price <= :max_price
+    ORDER BY l.price DESC
+    LIMIT :page_size OFFSET :offset
+""").bindparams(
+    bindparam('search', type_=String),
+    bindparam('min_price', type_=Integer),
+    bindparam('max_price', type_=Integer),
+    bindparam('page_size', type_=Integer),
+    bindparam('offset', type_=Integer)
+)
+
 # Configuração do banco de dados
+@st.cache_resource
+def _engine():
+    """Engine único por processo: o pool de conexões sobrevive aos reruns"""
+    # Railway PostgreSQL
+    if 'DATABASE_URL' in os.environ:
+        db_url = os.environ['DATABASE_URL']
+    
+    # Local PostgreSQL
+    elif 'POSTGRES_HOST' in os.environ:
+        db_url = f"postgresql://{os.environ.get('POSTGRES_USER', 'postgres')}:{os.environ.get('POSTGRES_PASSWORD', 'password')}@{os.environ.get('POSTGRES_HOST', 'localhost')}:{os.environ.get('POSTGRES_PORT', '5432')}/{os.environ.get('POSTGRES_DB', 'skinlytics')}"
+    
+    # Fallback para SQLite local
+    else:
+        return create_engine('sqlite:///data/skins_saas.db')
+    
+    return create_engine(
+        db_url,
+        pool_size=10,
+        max_overflow=5,
+        pool_pre_ping=True,   # Descarta conexões derrubadas pelo servidor
+        pool_recycle=1800,
+        executemany_mode='values_plus_batch'  # executemany vira INSERT ... VALUES em lotes
+    )
+
 def get_db_connection():
     """Conecta com o PostgreSQL"""
     try:
-        # Railway PostgreSQL
-        if 'DATABASE_URL' in os.environ:
-            return create_engine(os.environ['DATABASE_URL'])
-        
-        # Local PostgreSQL
-        elif 'POSTGRES_HOST' in os.environ:
-            db_url = f"postgresql://{os.environ.get('POSTGRES_USER', 'postgres')}:{os.environ.get('POSTGRES_PASSWORD', 'password')}@{os.environ.get('POSTGRES_HOST', 'localhost')}:{os.environ.get('POSTGRES_PORT', '5432')}/{os.environ.get('POSTGRES_DB', 'skinlytics')}"
-            return create_engine(db_url)
-        
-        # Fallback para SQLite local
-        else:
-            return create_engine('sqlite:///data/skins_saas.db')
-            
+        return _engine()
     except Exception as e:
         st.error(f"Erro ao conectar com banco: {e}")
         return None
 
+# Schema do dashboard (PostgreSQL): enviado num único round-trip no startup
+_SCHEMA_DDL = """
+-- Tabela skins_optimized
+CREATE TABLE IF NOT EXISTS skins_optimized (
+    id SERIAL PRIMARY KEY,
+    market_hash_name VARCHAR(255) NOT NULL,
+    rarity INTEGER DEFAULT 0,
+    is_stattrak BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Tabela listings_optimized
+CREATE TABLE IF NOT EXISTS listings_optimized (
+    id SERIAL PRIMARY KEY,
+    skin_id INTEGER REFERENCES skins_optimized(id),
+    price INTEGER NOT NULL,
+    float_value DECIMAL(10,8),
+    watchers INTEGER DEFAULT 0,
+    collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Tabela price_history
+CREATE TABLE IF NOT EXISTS price_history (
+    id SERIAL PRIMARY KEY,
+    skin_id INTEGER REFERENCES skins_optimized(id),
+    price INTEGER NOT NULL,
+    date DATE NOT NULL,
+    volume INTEGER DEFAULT 1,
+    UNIQUE(skin_id, date)
+);
+
+-- Tabela market_insights
+CREATE TABLE IF NOT EXISTS market_insights (
+    id SERIAL PRIMARY KEY,
+    date DATE NOT NULL,
+    total_listings INTEGER DEFAULT 0,
+    total_value DECIMAL(15,2) DEFAULT 0,
+    avg_price DECIMAL(10,2) DEFAULT 0,
+    volatility_index DECIMAL(5,2) DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(date)
+);
+
+-- Índice de cobertura do Explorer: ORDER BY price DESC LIMIT sai direto do índice,
+-- sem ler o heap para float_value/watchers
+CREATE INDEX IF NOT EXISTS idx_listings_skin_price
+    ON listings_optimized (skin_id, price DESC) INCLUDE (float_value, watchers);
+
+COMMENT ON TABLE listings_optimized IS
+    'Escrita em lote: psycopg2.extras.execute_values(..., page_size=1000) ou COPY FROM STDIN; nunca INSERT linha a linha';
+"""
+
+# Índice trigram para o ILIKE do Explorer. Opcional: sem privilégio para a extensão
+# a busca continua funcionando, só sem índice
+_SEARCH_INDEX_DDL = """
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_skins_name_trgm
+    ON skins_optimized USING gin (market_hash_name gin_trgm_ops);
+"""
+
+# Rollup diário de price_history: o dashboard lê ≤30 linhas em vez de agregar a tabela.
+# Atualizado pelo AggregationService (REFRESH ... CONCURRENTLY exige o índice único)
+_ROLLUP_DDL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_price_daily AS
+    SELECT date, AVG(price)::bigint AS avg_price, COUNT(*) AS volume
+    FROM price_history
+    GROUP BY date;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_price_daily_date ON mv_price_daily (date);
+"""
+
 def create_tables_if_not_exist():
     """Cria as tabelas se não existirem"""
     engine = get_db_connection()
@@ -85,61 +196,31 @@ def create_tables_if_not_exist():
     
     try:
         with engine.connect() as conn:
-            # Criar tabela skins_optimized
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS skins_optimized (
-                    id SERIAL PRIMARY KEY,
-                    market_hash_name VARCHAR(255) NOT NULL,
-                    rarity INTEGER DEFAULT 0,
-                    is_stattrak BOOLEAN DEFAULT FALSE,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """))
-            
-            # Criar tabela listings_optimized
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS listings_optimized (
-                    id SERIAL PRIMARY KEY,
-                    skin_id INTEGER REFERENCES skins_optimized(id),
-                    price INTEGER NOT NULL,
-                    float_value DECIMAL(10,8),
-                    watchers INTEGER DEFAULT 0,
-                    collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """))
-            
-            # Criar tabela price_history
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS price_history (
-                    id SERIAL PRIMARY KEY,
-                    skin_id INTEGER REFERENCES skins_optimized(id),
-                    price INTEGER NOT NULL,
-                    date DATE NOT NULL,
-                    volume INTEGER DEFAULT 1,
-                    UNIQUE(skin_id, date)
-                )
-            """))
-            
-            # Criar tabela market_insights
-            conn.execute(text("""
-                CREATE TABLE IF NOT EXISTS market_insights (
-                    id SERIAL PRIMARY KEY,
-                    date DATE NOT NULL,
-                    total_listings INTEGER DEFAULT 0,
-                    total_value DECIMAL(15,2) DEFAULT 0,
-                    avg_price DECIMAL(10,2) DEFAULT 0,
-                    volatility_index DECIMAL(5,2) DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(date)
-                )
-            """))
-            
+            # psycopg2 aceita vários comandos numa única string sem parâmetros
+            conn.exec_driver_sql(_SCHEMA_DDL)
             conn.commit()
-            return True
             
     except Exception as e:
         st.error(f"Erro ao criar tabelas: {e}")
         return False
+    
+    # Índice de busca opcional: se falhar, o ILIKE do Explorer faz varredura
+    try:
+        with engine.connect() as conn:
+            conn.exec_driver_sql(_SEARCH_INDEX_DDL)
+            conn.commit()
+    except Exception as e:
+        st.warning(f"⚠️ Índice de busca (pg_trgm) indisponível: {e}")
+    
+    # A view é opcional: se falhar, load_price_history agrega direto da tabela
+    try:
+        with engine.connect() as conn:
+            conn.exec_driver_sql(_ROLLUP_DDL)
+            conn.commit()
+    except Exception as e:
+        st.warning(f"⚠️ Rollup de preços indisponível: {e}")
+    
+    return True
 
 # Criar tabelas automaticamente
 if 'RAILWAY_ENVIRONMENT' in os.environ:
@@ -196,22 +277,20 @@ if 'RAILWAY_ENVIRONMENT' in os.environ:
                             """), {'name': skin_name})
                             skin_ids.append(result.fetchone()[0])
                     
-                    # Inserir listings
-                    for i in range(100):
-                        skin_id = random.choice(skin_ids)
-                        price = random.randint(1000, 500000)
-                        float_value = round(random.uniform(0.01, 0.99), 8)
-                        watchers = random.randint(0, 50)
-                        
-                        conn.execute(text("""
-                            INSERT INTO listings_optimized (skin_id, price, float_value, watchers)
-                            VALUES (:skin_id, :price, :float_value, :watchers)
-                        """), {
-                            'skin_id': skin_id,
-                            'price': price,
-                            'float_value': float_value,
-                            'watchers': watchers
-                        })
+                    # Inserir listings: uma única chamada executemany (enviada em lotes pelo driver)
+                    listings = [
+                        {
+                            'skin_id': random.choice(skin_ids),
+                            'price': random.randint(1000, 500000),
+                            'float_value': round(random.uniform(0.01, 0.99), 8),
+                            'watchers': random.randint(0, 50)
+                        }
+                        for _ in range(100)
+                    ]
+                    conn.execute(text("""
+                        INSERT INTO listings_optimized (skin_id, price, float_value, watchers)
+                        VALUES (:skin_id, :price, :float_value, :watchers)
+                    """), listings)
                     
                     conn.commit()
                     st.success("✅ Dados de exemplo inseridos!")
@@ -219,78 +298,83 @@ if 'RAILWAY_ENVIRONMENT' in os.environ:
     except Exception as e:
         st.warning(f"⚠️ Erro ao popular dados: {e}")
 
-@st.cache_data(ttl=300)  # 5 minutos de cache
-def load_real_market_data():
-    """Carrega dados reais do mercado"""
+def _query_rows(sql: str):
+    """Executa uma consulta e devolve as linhas como tuplas (None em caso de erro)"""
     engine = get_db_connection()
     if not engine:
         return None
     
     try:
         with engine.connect() as conn:
-            # Estatísticas gerais
-            result = conn.execute(text("SELECT COUNT(*) as total FROM listings_optimized"))
-            total_listings = result.fetchone()[0]
-            
-            result = conn.execute(text("SELECT COUNT(*) as total FROM skins_optimized"))
-            total_skins = result.fetchone()[0]
-            
-            result = conn.execute(text("SELECT SUM(price) as total_value FROM listings_optimized WHERE price > 0"))
-            total_value_result = result.fetchone()[0]
-            total_value = total_value_result / 100 if total_value_result else 0  # Convert to USD
-            
-            result = conn.execute(text("SELECT AVG(price) as avg_price FROM listings_optimized WHERE price > 0"))
-            avg_price_result = result.fetchone()[0]
-            avg_price = avg_price_result / 100 if avg_price_result else 0
-            
-            # Últimos listings
-            result = conn.execute(text("""
-                SELECT l.id, l.price, l.float_value, l.watchers, l.collected_at, s.market_hash_name, s.rarity
-                FROM listings_optimized l
-                JOIN skins_optimized s ON l.skin_id = s.id
-                ORDER BY l.collected_at DESC
-                LIMIT 20
-            """))
-            recent_listings = result.fetchall()
-            
-            # Distribuição por raridade
-            result = conn.execute(text("""
-                SELECT s.rarity, COUNT(l.id) as count
-                FROM skins_optimized s
-                JOIN listings_optimized l ON s.id = l.skin_id
-                GROUP BY s.rarity
-                ORDER BY count DESC
-            """))
-            rarity_dist = result.fetchall()
-            
-            # Top skins por volume
-            result = conn.execute(text("""
-                SELECT s.market_hash_name, COUNT(l.id) as volume, AVG(l.price) as avg_price
-                FROM skins_optimized s
-                JOIN listings_optimized l ON s.id = l.skin_id
-                WHERE l.price > 0
-                GROUP BY s.id, s.market_hash_name
-                ORDER BY volume DESC
-                LIMIT 10
-            """))
-            top_skins = result.fetchall()
-            
-        return {
-            'stats': {
-                'total_listings': total_listings,
-                'total_skins': total_skins,
-                'total_value': total_value,
-                'avg_price': avg_price
-            },
-            'recent_listings': recent_listings,
-            'rarity_dist': rarity_dist,
-            'top_skins': top_skins
-        }
-        
+            return [tuple(row) for row in conn.execute(text(sql))]
     except Exception as e:
         st.error(f"Erro ao carregar dados: {e}")
         return None
 
+# Cada bloco do dashboard tem seu próprio cache/TTL: expirar um não recalcula os outros
+@st.cache_data(ttl=60)
+def load_stats():
+    """Estatísticas gerais: uma única varredura e um único round-trip (valores já em USD)"""
+    rows = _query_rows("""
+        SELECT COUNT(*) AS total_listings,
+               (SELECT COUNT(*) FROM skins_optimized) AS total_skins,
+               CAST(SUM(price) FILTER (WHERE price > 0) AS DOUBLE PRECISION) / 100 AS total_value_usd,
+               CAST(AVG(price) FILTER (WHERE price > 0) AS DOUBLE PRECISION) / 100 AS avg_price_usd
+        FROM listings_optimized
+    """)
+    if not rows:
+        return None
+    
+    total_listings, total_skins, total_value_usd, avg_price_usd = rows[0]
+    return {
+        'total_listings': total_listings,
+        'total_skins': total_skins,
+        'total_value': total_value_usd or 0,
+        'avg_price': avg_price_usd or 0
+    }
+
+@st.cache_data(ttl=30)
+def load_recent_listings():
+    """Últimos listings"""
+    return _query_rows("""
+        SELECT l.id, CAST(l.price AS DOUBLE PRECISION) / 100 AS price_usd,
+               l.float_value, l.watchers, l.collected_at, s.market_hash_name, s.rarity
+        FROM listings_optimized l
+        JOIN skins_optimized s ON l.skin_id = s.id
+        ORDER BY l.collected_at DESC
+        LIMIT 20
+    """) or []
+
+@st.cache_data(ttl=600)
+def load_rarity_dist():
+    """Distribuição por raridade"""
+    return _query_rows("""
+        SELECT COALESCE(s.rarity, -1) AS rarity, COUNT(l.id) as count
+        FROM skins_optimized s
+        JOIN listings_optimized l ON s.id = l.skin_id
+        GROUP BY COALESCE(s.rarity, -1)
+        ORDER BY count DESC
+    """) or []
+
+@st.cache_data(ttl=300)
+def load_top_skins():
+    """Top skins por volume, já com o rank (volume x preço médio) calculado no banco"""
+    return _query_rows("""
+        SELECT market_hash_name, volume, avg_price_usd,
+               ROW_NUMBER() OVER (ORDER BY volume * avg_price_usd DESC) AS score
+        FROM (
+            SELECT s.market_hash_name, COUNT(l.id) as volume,
+                   CAST(AVG(l.price) AS DOUBLE PRECISION) / 100 as avg_price_usd
+            FROM skins_optimized s
+            JOIN listings_optimized l ON s.id = l.skin_id
+            WHERE l.price > 0
+            GROUP BY s.id, s.market_hash_name
+            ORDER BY volume DESC
+            LIMIT 10
+        ) top
+        ORDER BY volume DESC
+    """) or []
+
 @st.cache_data(ttl=600)  # 10 minutos de cache
 def load_price_history():
     """Carrega histórico de preços"""
@@ -300,14 +384,24 @@ def load_price_history():
     
     try:
         with engine.connect() as conn:
-            # Últimos 30 dias de preços
-            result = conn.execute(text("""
-                SELECT date, AVG(price) as avg_price, COUNT(*) as volume
-                FROM price_history
-                WHERE date >= CURRENT_DATE - INTERVAL '30 days'
-                GROUP BY date
-                ORDER BY date
-            """))
+            # Últimos 30 dias de preços, lidos do rollup diário
+            try:
+                result = conn.execute(text("""
+                    SELECT date, CAST(avg_price AS DOUBLE PRECISION) / 100 AS avg_price_usd, volume
+                    FROM mv_price_daily
+                    WHERE date >= CURRENT_DATE - 30
+                    ORDER BY date
+                """))
+            except Exception:
+                # Sem a view (ex.: banco local): agrega direto de price_history
+                conn.rollback()
+                result = conn.execute(text("""
+                    SELECT date, CAST(AVG(price) AS DOUBLE PRECISION) / 100 as avg_price_usd, COUNT(*) as volume
+                    FROM price_history
+                    WHERE date >= CURRENT_DATE - INTERVAL '30 days'
+                    GROUP BY date
+                    ORDER BY date
+                """))
             price_history = result.fetchall()
             
         return price_history
@@ -316,27 +410,99 @@ def load_price_history():
         st.error(f"Erro ao carregar histórico: {e}")
         return None
 
+@st.cache_data(ttl=60)
+def _listings_estimate():
+    """Contagem aproximada de listings (pg_class.reltuples, atualizado pelo ANALYZE)"""
+    engine = get_db_connection()
+    with engine.connect() as conn:
+        if engine.dialect.name == 'postgresql':
+            count = conn.execute(text(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = 'listings_optimized'"
+            )).scalar()
+            # reltuples = -1 enquanto a tabela nunca foi analisada
+            if count is not None and count >= 0:
+                return count
+        return conn.execute(text("SELECT COUNT(*) FROM listings_optimized")).scalar()
+
 def show_database_status():
     """Mostra status da conexão com o banco"""
     engine = get_db_connection()
+    st.session_state['_db_ok'] = False
     if engine:
         try:
             with engine.connect() as conn:
-                result = conn.execute(text("SELECT COUNT(*) FROM listings_optimized"))
-                count = result.fetchone()[0]
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.success(f"✅ Banco conectado")
-                with col2:
-                    st.info(f"📊 {count:,} listings")
-                with col3:
-                    st.info(f"🕐 {datetime.now().strftime('%H:%M:%S')}")
+                # Ping trivial: não toca na tabela
+                conn.execute(text("SELECT 1"))
+            st.session_state['_db_ok'] = True
+            count = _listings_estimate()
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.success(f"✅ Banco conectado")
+            with col2:
+                st.info(f"📊 ~{count:,} listings")
+            with col3:
+                st.info(f"🕐 {datetime.now().strftime('%H:%M:%S')}")
         except Exception as e:
             st.error(f"❌ Erro no banco: {e}")
     else:
         st.warning("⚠️ Banco não conectado")
 
+def _hash_frame(df: pd.DataFrame) -> bytes:
+    """Hash de conteúdo do DataFrame usado como chave dos caches de figuras"""
+    return pd.util.hash_pandas_object(df, index=True).values.tobytes()
+
+# Figuras ficam em st.cache_resource: com os dados inalterados (caso comum dentro do TTL)
+# o rerun reaproveita a figura pronta. Compartilhadas entre sessões, nunca devem ser mutadas.
+# O plotly é importado só quando um gráfico é construído (cold start mais rápido no Railway)
+@st.cache_resource(hash_funcs={pd.DataFrame: _hash_frame})
+def _make_pie(rarity_df: pd.DataFrame) -> "go.Figure":
+    """Pizza da distribuição por raridade"""
+    import plotly.express as px
+    
+    return px.pie(
+        rarity_df, 
+        values='Quantidade', 
+        names='Raridade',
+        title="📊 Distribuição por Raridade",
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+
+@st.cache_resource(hash_funcs={pd.DataFrame: _hash_frame})
+def _make_bar(rarity_df: pd.DataFrame) -> "go.Figure":
+    """Barras de quantidade por raridade"""
+    import plotly.express as px
+    
+    return px.bar(
+        rarity_df,
+        x='Raridade',
+        y='Quantidade',
+        title="📈 Quantidade por Raridade",
+        color='Quantidade',
+        color_continuous_scale='viridis'
+    )
+
+@st.cache_resource(hash_funcs={pd.DataFrame: _hash_frame})
+def _make_price_line(price_df: pd.DataFrame) -> "go.Figure":
+    """Linha do preço médio diário"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=price_df['date'],
+        y=price_df['avg_price_usd'],
+        mode='lines+markers',
+        name='Preço Médio',
+        line=dict(color='#FF6B35', width=2)
+    ))
+    fig.update_layout(
+        title="📈 Evolução de Preços (Últimos 30 dias)",
+        xaxis_title="Data",
+        yaxis_title="Preço Médio ($)",
+        hovermode='x'
+    )
+    return fig
+
 def main():
     """Função principal do dashboard"""
     
@@ -361,15 +527,17 @@ def main():
         show_debug = st.checkbox("Mostrar debug", value=False)
         
         if auto_refresh:
-            time.sleep(30)
-            st.rerun()
+            # O timer roda no cliente: o servidor não fica preso esperando 30s
+            if AUTOREFRESH_AVAILABLE:
+                st_autorefresh(interval=30_000, key="dashrefresh")
+            else:
+                st.caption("⚠️ Instale streamlit-autorefresh para o auto-refresh")
     
     # Carregar dados reais
     with st.spinner("🔄 Carregando dados reais do mercado..."):
-        market_data = load_real_market_data()
-        price_history = load_price_history()
+        stats = load_stats()
     
-    if not market_data:
+    if not stats:
         st.error("❌ Não foi possível carregar os dados. Verifique se o collector está rodando.")
         return
     
@@ -379,28 +547,28 @@ def main():
     with col1:
         st.metric(
             label="📦 Total Listings",
-            value=f"{market_data['stats']['total_listings']:,}",
+            value=f"{stats['total_listings']:,}",
             delta="Dados reais"
         )
     
     with col2:
         st.metric(
             label="🎨 Skins Únicas",
-            value=f"{market_data['stats']['total_skins']:,}",
+            value=f"{stats['total_skins']:,}",
             delta="CSFloat"
         )
     
     with col3:
         st.metric(
             label="💰 Valor Total",
-            value=f"${market_data['stats']['total_value']:,.2f}",
+            value=f"${stats['total_value']:,.2f}",
             delta="USD"
         )
     
     with col4:
         st.metric(
             label="📊 Preço Médio",
-            value=f"${market_data['stats']['avg_price']:.2f}",
+            value=f"${stats['avg_price']:.2f}",
             delta="Por item"
         )
     
@@ -410,33 +578,15 @@ def main():
     with tab1:
         st.subheader("🏆 Top Oportunidades de Trading")
         
-        if market_data['top_skins']:
-            # Criar DataFrame para análise
-            df = pd.DataFrame(market_data['top_skins'], 
-                            columns=['skin_name', 'volume', 'avg_price'])
-            df['avg_price_usd'] = df['avg_price'] / 100
-            
-            # Calcular scores simples
-            df['score'] = (df['volume'] * df['avg_price_usd']).rank(ascending=False)
-            
-            # Mostrar top oportunidades
-            for i, row in df.head(10).iterrows():
-                col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-                
-                with col1:
-                    st.write(f"**{i+1}. {row['skin_name'][:50]}**")
-                
-                with col2:
-                    st.metric("Preço", f"${row['avg_price_usd']:.2f}")
-                
-                with col3:
-                    st.metric("Volume", f"{row['volume']}")
-                
-                with col4:
-                    score_color = "green" if row['score'] <= 3 else "orange"
-                    st.markdown(f"<span style='color:{score_color};font-weight:bold'>{row['score']:.0f}</span>", unsafe_allow_html=True)
-                
-                st.divider()
+        top_skins = load_top_skins()
+        if top_skins:
+            # Mostrar top oportunidades (score já vem do SQL) numa única tabela
+            top_df = pd.DataFrame(top_skins, columns=['Skin', 'Volume', 'Preço', 'Score'])
+            top_df.insert(0, '#', range(1, len(top_df) + 1))
+            styled = top_df.style.background_gradient(subset=['Score'], cmap='RdYlGn_r').format(
+                {'Preço': '${:.2f}', 'Score': '{:.0f}'}
+            )
+            st.dataframe(styled, hide_index=True, use_container_width=True)
         else:
             st.info("🔄 Carregando oportunidades... Execute o collector para obter dados.")
     
@@ -444,76 +594,57 @@ def main():
         st.subheader("📊 Visão Geral do Mercado")
         
         # Gráfico de distribuição por raridade
-        if market_data['rarity_dist']:
-            rarity_names = {0: "Consumer", 1: "Industrial", 2: "Mil-Spec", 3: "Restricted", 
-                          4: "Classified", 5: "Covert", 6: "Contraband", 7: "★ Knife"}
+        rarity_dist = load_rarity_dist()
+        if rarity_dist:
+            codes = np.fromiter((r[0] for r in rarity_dist), dtype=np.int64)
+            counts = np.fromiter((r[1] for r in rarity_dist), dtype=np.int64)
+            
+            # Códigos fora da tabela ganham categoria própria ("Rarity N"; -1 = rarity NULL)
+            unknown = (codes < 0) | (codes >= len(_RARITY_LEVELS))
+            extra = np.unique(codes[unknown])
+            categories = _RARITY_LEVELS + [
+                "Desconhecida" if code == -1 else f"Rarity {code}" for code in extra.tolist()
+            ]
+            codes[unknown] = len(_RARITY_LEVELS) + np.searchsorted(extra, codes[unknown])
             
-            rarity_df = pd.DataFrame([
-                {'Raridade': rarity_names.get(r[0], f"Rarity {r[0]}"), 'Quantidade': r[1]}
-                for r in market_data['rarity_dist']
-            ])
+            rarity_df = pd.DataFrame({
+                'Raridade': pd.Categorical.from_codes(codes, categories=categories),
+                'Quantidade': counts
+            })
             
             col1, col2 = st.columns(2)
             
             with col1:
-                fig_pie = px.pie(
-                    rarity_df, 
-                    values='Quantidade', 
-                    names='Raridade',
-                    title="📊 Distribuição por Raridade",
-                    color_discrete_sequence=px.colors.qualitative.Set3
-                )
-                st.plotly_chart(fig_pie, use_container_width=True)
+                st.plotly_chart(_make_pie(rarity_df), use_container_width=True)
             
             with col2:
-                fig_bar = px.bar(
-                    rarity_df,
-                    x='Raridade',
-                    y='Quantidade',
-                    title="📈 Quantidade por Raridade",
-                    color='Quantidade',
-                    color_continuous_scale='viridis'
-                )
-                st.plotly_chart(fig_bar, use_container_width=True)
+                st.plotly_chart(_make_bar(rarity_df), use_container_width=True)
         
         # Últimos listings
         st.subheader("⏰ Últimos Listings")
-        if market_data['recent_listings']:
-            recent_df = pd.DataFrame([
-                {
-                    'Skin': listing[5][:40],
-                    'Preço': f"${listing[1]/100:.2f}",
-                    'Float': f"{listing[2]:.4f}" if listing[2] else "N/A",
-                    'Watchers': listing[3] or 0,
-                    'Coletado': listing[4].strftime("%H:%M:%S") if listing[4] else "N/A"
-                }
-                for listing in market_data['recent_listings']
-            ])
+        recent_listings = load_recent_listings()
+        if recent_listings:
+            listings = pd.DataFrame.from_records(
+                recent_listings,
+                columns=['id', 'price_usd', 'float_value', 'watchers', 'collected_at', 'market_hash_name', 'rarity']
+            ).astype({'price_usd': 'float32'})
+            recent_df = pd.DataFrame({
+                'Skin': listings['market_hash_name'].str[:40],
+                'Preço': listings['price_usd'].map('${:.2f}'.format),
+                'Float': pd.to_numeric(listings['float_value']).round(4).astype('string').fillna("N/A"),
+                'Watchers': listings['watchers'].fillna(0).astype(int),
+                'Coletado': pd.to_datetime(listings['collected_at']).dt.strftime("%H:%M:%S").fillna("N/A")
+            })
             st.dataframe(recent_df, use_container_width=True)
     
     with tab3:
         st.subheader("📈 Tendências de Preços")
         
+        price_history = load_price_history()
         if price_history:
             # Criar gráfico de preços
-            price_df = pd.DataFrame(price_history, columns=['date', 'avg_price', 'volume'])
-            price_df['avg_price_usd'] = price_df['avg_price'] / 100
-            
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=price_df['date'],
-                y=price_df['avg_price_usd'],
-                mode='lines+markers',
-                name='Preço Médio',
-                line=dict(color='#FF6B35', width=2)
-            ))
-            fig.update_layout(
-                title="📈 Evolução de Preços (Últimos 30 dias)",
-                xaxis_title="Data",
-                yaxis_title="Preço Médio ($)",
-                hovermode='x'
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            price_df = pd.DataFrame(price_history, columns=['date', 'avg_price_usd', 'volume'])
+            st.plotly_chart(_make_price_line(price_df), use_container_width=True)
             
             # Estatísticas
             col1, col2, col3 = st.columns(3)
@@ -530,51 +661,53 @@ def main():
     with tab4:
         st.subheader("🔍 Explorer de Dados")
         
-        # Filtros avançados
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            search_term = st.text_input("🔍 Buscar skin", placeholder="Ex: AK-47, AWP...")
-        with col2:
-            price_range = st.slider("💰 Faixa de preço ($)", 0, 1000, (0, 100))
-        with col3:
-            rarity_filter = st.selectbox("🎨 Raridade", ["Todas", "Consumer", "Industrial", "Mil-Spec", "Restricted", "Classified", "Covert"])
+        # Filtros avançados: dentro de um form a busca só roda quando o usuário confirma,
+        # não a cada tecla ou movimento do slider
+        with st.form("explorer_search"):
+            col1, col2, col3, col4 = st.columns([3, 3, 2, 1])
+            with col1:
+                search_term = st.text_input("🔍 Buscar skin", placeholder="Ex: AK-47, AWP...")
+            with col2:
+                price_range = st.slider("💰 Faixa de preço ($)", 0, 1000, (0, 100))
+            with col3:
+                rarity_filter = st.selectbox("🎨 Raridade", ["Todas", "Consumer", "Industrial", "Mil-Spec", "Restricted", "Classified", "Covert"])
+            with col4:
+                page = st.number_input("Página", min_value=1, value=1, step=1)
+            st.form_submit_button("Buscar")
         
         # Busca em tempo real
         if search_term:
             engine = get_db_connection()
             if engine:
                 try:
-                    with engine.connect() as conn:
-                        query = """
-                            SELECT s.market_hash_name, l.price, l.float_value, s.rarity, l.watchers
-                            FROM skins_optimized s
-                            JOIN listings_optimized l ON s.id = l.skin_id
-                            WHERE s.market_hash_name ILIKE :search
-                            AND l.price >= :min_price AND l.price <= :max_price
-                            ORDER BY l.price DESC
-                            LIMIT 50
-                        """
-                        result = conn.execute(text(query), {
+                    # Cursor no servidor: as linhas chegam em lotes de 200 em vez de
+                    # todo o resultado ser bufferizado no cliente psycopg2
+                    with engine.connect().execution_options(stream_results=True, yield_per=200) as conn:
+                        result = conn.execute(_SEARCH_STMT, {
                             'search': f'%{search_term}%',
                             'min_price': price_range[0] * 100,
-                            'max_price': price_range[1] * 100
+                            'max_price': price_range[1] * 100,
+                            'page_size': SEARCH_PAGE_SIZE,
+                            'offset': (page - 1) * SEARCH_PAGE_SIZE
                         })
-                        results = result.fetchall()
+                        batches = [
+                            pd.DataFrame.from_records(
+                                partition,
+                                columns=['Skin', 'Preço', 'Float', 'Raridade', 'Watchers']
+                            )
+                            for partition in result.partitions()
+                        ]
                         
-                        if results:
-                            results_df = pd.DataFrame([
-                                {
-                                    'Skin': row[0],
-                                    'Preço': f"${row[1]/100:.2f}",
-                                    'Float': f"{row[2]:.6f}" if row[2] else "N/A",
-                                    'Raridade': row[3],
-                                    'Watchers': row[4] or 0
-                                }
-                                for row in results
-                            ])
+                        if batches:
+                            results_df = pd.concat(batches, ignore_index=True)
+                            results_df['Preço'] = results_df['Preço'].astype('float32').map('${:.2f}'.format)
+                            results_df['Float'] = results_df['Float'].map(
+                                lambda v: f"{v:.6f}" if v else "N/A"
+                            )
+                            results_df['Watchers'] = results_df['Watchers'].fillna(0).astype(int)
                             
                             st.dataframe(results_df, use_container_width=True)
-                            st.success(f"✅ Encontrados {len(results)} resultados para '{search_term}'")
+                            st.success(f"✅ Encontrados {len(results_df)} resultados para '{search_term}'")
                         else:
                             st.warning(f"❌ Nenhum resultado encontrado para '{search_term}'")
                             
@@ -598,9 +731,9 @@ def main():
         st.subheader("🐛 Debug Info")
         st.json({
             "timestamp": datetime.now().isoformat(),
-            "data_loaded": market_data is not None,
-            "price_history_loaded": price_history is not None,
-            "database_connected": get_db_connection() is not None,
+            "data_loaded": stats is not None,
+            "price_history_loaded": load_price_history() is not None,
+            "database_connected": st.session_state.get('_db_ok', False),
             "cache_stats": "Active"
         })
 
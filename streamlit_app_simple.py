@@ -7,37 +7,14 @@ Versão simplificada para teste inicial
 import os
 import streamlit as st
 import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
 import time
 
-# Configuração da página
-st.set_page_config(
-    page_title="Skinlytics - CS2 Trading Intelligence",
-    page_icon="🎯",
-    layout="wide"
-)
+from demo_data import configure_page, fake_price_timeline, inject_css, render_sidebar_features
 
-# CSS customizado
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #FF6B35;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-        margin: 0.5rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Configuração da página
+configure_page()
+inject_css()
 
 def main():
     """Função principal do dashboard"""
@@ -48,12 +25,7 @@ def main():
     
     # Sidebar
     with st.sidebar:
-        st.image("https://via.placeholder.com/200x100/FF6B35/FFFFFF?text=SKINLYTICS", width=200)
-        st.markdown("### 🚀 Features")
-        st.markdown("- 📊 Dados em tempo real")
-        st.markdown("- 🎯 Oportunidades de trading")
-        st.markdown("- 📈 Análise de tendências")
-        st.markdown("- 🔍 Filtros avançados")
+        render_sidebar_features()
         
         st.markdown("### ⚙️ Configurações")
         auto_refresh = st.checkbox("Auto-refresh (30s)", value=False)
@@ -162,15 +134,7 @@ def main():
         
         # Gráfico de linha simples
         st.subheader("📊 Evolução de Preços (Simulação)")
-        dates = pd.date_range(start='2025-01-01', end='2025-08-06', freq='D')
-        prices = np.random.normal(100, 20, len(dates)).cumsum()
-        
-        price_df = pd.DataFrame({
-            'Data': dates,
-            'Preço': prices
-        })
-        
-        st.line_chart(price_df.set_index('Data'))
+        st.line_chart(fake_price_timeline())
     
     with tab4:
         st.subheader("🔍 Explorer de Dados")
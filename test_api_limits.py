@@ -21,12 +21,26 @@ import time
 import json
 import os
 import argparse
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional
 from dataclasses import dataclass, asdict
 import logging
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Transporte HTTP/2 opcional (pip install "httpx[http2]")
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -34,7 +48,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Headers de rate limiting comuns -> chave no rate_limit_info
+_RATE_HEADERS = (
+    ('x-ratelimit-limit', 'limit'),
+    ('x-ratelimit-remaining', 'remaining'),
+    ('x-ratelimit-reset', 'reset'),
+    ('retry-after', 'retry_after'),
+    ('ratelimit-limit', 'limit_alt'),
+    ('ratelimit-remaining', 'remaining_alt'),
+    ('ratelimit-reset', 'reset_alt'),
+)
+
+# Prefixos dos headers guardados em cada resultado (o resto é descartado)
+_KEPT_HEADER_PREFIXES = ('x-ratelimit', 'ratelimit', 'retry-after', 'content-length')
+
+def _kept_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Filtra os headers guardados no resultado (chaves viram str: o orjson recusa o istr do aiohttp)"""
+    return {
+        str(k): v for k, v in headers.items()
+        if k.lower().startswith(_KEPT_HEADER_PREFIXES)
+    }
+
+@dataclass(slots=True)
 class APITestResult:
     """Resultado de um teste de API"""
     endpoint: str
@@ -49,51 +84,115 @@ class APITestResult:
 class CSFloatAPITester:
     """Testador de limites da API CSFloat"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http2: bool = False, results_path: Optional[Path] = None):
         self.api_key = api_key
         self.base_url = "https://csfloat.com/api/v1"
-        self.results: List[APITestResult] = []
         self.session = None
+        self.http2 = http2
+        self.client = None  # httpx.AsyncClient quando o transporte HTTP/2 está ativo
+        self._next_allowed = 0.0  # time.monotonic() a partir do qual a próxima requisição pode sair
+        self._last_rate_info: Dict[str, Any] = {}  # Último rate_limit_info não vazio recebido
+        
+        # Resultados vão para um JSONL em disco; em memória ficam só os agregados do relatório
+        self.results_path = results_path
+        self._jsonl = None
+        self._n_total = 0
+        self._codes: Counter = Counter()
+        self._rt_sum = 0.0
+        self._rt_n = 0
+        self._rt_min = float('inf')
+        self._rt_max = 0.0
+        self._first_ts: Optional[datetime] = None
+        self._last_ts: Optional[datetime] = None
+        self._detected_headers: set = set()
         
     async def __aenter__(self):
         """Async context manager entry"""
+        if self.results_path:
+            self._jsonl = open(self.results_path, 'ab')
+        
         headers = {
             'User-Agent': 'CS2-Skin-Tracker-Tester/2.0',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            'Connection': 'keep-alive'
         }
         
         if self.api_key:
             headers['Authorization'] = self.api_key
         
+        # Conexões keep-alive reaproveitadas entre os testes (sem novo handshake TLS por requisição)
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            keepalive_timeout=75,
+            use_dns_cache=True,
+            ttl_dns_cache=300,  # Uma resolução DNS a cada 5 min, não por conexão
+            enable_cleanup_closed=True
+        )
+        
+        # A sessão é dona do connector: session.close() no __aexit__ fecha os dois
+        # O User-Agent já vem nos headers da sessão: o aiohttp não precisa gerar o padrão
         self.session = aiohttp.ClientSession(
+            connector=connector,
             headers=headers,
-            timeout=aiohttp.ClientTimeout(total=30)
+            skip_auto_headers=('User-Agent',),
+            timeout=aiohttp.ClientTimeout(total=30, sock_connect=5)
         )
+        
+        # HTTP/2: uma única conexão TLS multiplexa todas as requisições da rajada
+        if self.http2:
+            if not HTTPX_AVAILABLE:
+                logger.warning("⚠️ httpx não instalado - usando aiohttp (HTTP/1.1)")
+            else:
+                try:
+                    self.client = httpx.AsyncClient(
+                        http2=True,
+                        headers=headers,
+                        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=75),
+                        timeout=30
+                    )
+                except ImportError:
+                    logger.warning("⚠️ Pacote h2 ausente - usando aiohttp (HTTP/1.1)")
+        
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
+        if self.client:
+            await self.client.aclose()
         if self.session:
             await self.session.close()
+        if self._jsonl:
+            self._jsonl.close()
+    
+    def _record(self, result: APITestResult):
+        """Grava o resultado no JSONL e atualiza os agregados do relatório"""
+        if self._jsonl:
+            data = asdict(result)
+            if ORJSON_AVAILABLE:
+                self._jsonl.write(orjson.dumps(data) + b'\n')
+            else:
+                self._jsonl.write((json.dumps(data, ensure_ascii=False, default=str) + '\n').encode('utf-8'))
+        
+        self._n_total += 1
+        self._codes[result.status_code] += 1
+        if result.response_time > 0:
+            self._rt_sum += result.response_time
+            self._rt_n += 1
+            self._rt_min = min(self._rt_min, result.response_time)
+            self._rt_max = max(self._rt_max, result.response_time)
+        if self._first_ts is None:
+            self._first_ts = result.timestamp
+        self._last_ts = result.timestamp
+        self._detected_headers.update(result.rate_limit_info)
     
-    def _extract_rate_limit_info(self, headers: Dict[str, str]) -> Dict[str, Any]:
-        """Extrai informações de rate limiting dos headers"""
+    def _extract_rate_limit_info(self, headers: Mapping[str, str]) -> Dict[str, Any]:
+        """Extrai informações de rate limiting dos headers (CIMultiDict: busca já ignora maiúsculas)"""
         rate_info = {}
         
-        # Headers de rate limiting comuns
-        rate_headers = {
-            'x-ratelimit-limit': 'limit',
-            'x-ratelimit-remaining': 'remaining', 
-            'x-ratelimit-reset': 'reset',
-            'retry-after': 'retry_after',
-            'ratelimit-limit': 'limit_alt',
-            'ratelimit-remaining': 'remaining_alt',
-            'ratelimit-reset': 'reset_alt'
-        }
-        
-        for header, key in rate_headers.items():
-            value = headers.get(header) or headers.get(header.upper())
-            if value:
+        for header, key in _RATE_HEADERS:
+            value = headers.get(header)
+            if value is not None:
                 try:
                     # Tentar converter para int
                     rate_info[key] = int(value)
@@ -103,34 +202,57 @@ class CSFloatAPITester:
         return rate_info
     
     async def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> APITestResult:
-        """Faz uma requisição e registra o resultado"""
-        url = f"{self.base_url}/{endpoint}"
-        start_time = time.time()
+        """Faz uma requisição e registra o resultado (latência medida até os headers)"""
+        return await self._make_request_url(endpoint, f"{self.base_url}/{endpoint}", params)
+    
+    async def _make_request_url(self, endpoint: str, url: str,
+                                params: Dict[str, Any] = None) -> APITestResult:
+        """Variante de _make_request com a URL já montada (para loops sobre o mesmo endpoint)"""
+        start_time = time.perf_counter()  # Monotônico e de alta resolução (time.time() sofre ajustes de NTP)
         
         try:
-            async with self.session.get(url, params=params) as response:
-                response_time = time.time() - start_time
-                
-                # Tentar ler resposta
-                try:
-                    await response.text()
-                except Exception:
-                    pass  # Não é crítico para o teste
-                
-                result = APITestResult(
-                    endpoint=endpoint,
-                    method="GET",
-                    status_code=response.status,
-                    response_time=response_time,
-                    headers=dict(response.headers),
-                    rate_limit_info=self._extract_rate_limit_info(dict(response.headers)),
-                    timestamp=datetime.now()
-                )
-                
-                return result
-                
+            if self.client is not None:
+                # httpx (HTTP/2); os headers também têm busca case-insensitive
+                async with self.client.stream("GET", url, params=params) as response:
+                    response_time = time.perf_counter() - start_time
+                    
+                    # Corpo drenado (sem guardar) depois da medição: sair do stream sem ler
+                    # fecha a conexão HTTP/1.1 e o próximo probe pagaria um handshake novo
+                    async for _ in response.aiter_raw():
+                        pass
+                    status_code, response_headers = response.status_code, response.headers
+            else:
+                async with self.session.get(url, params=params) as response:
+                    response_time = time.perf_counter() - start_time
+                    
+                    # O teste só usa status e headers, mas o corpo é drenado (sem guardar) depois
+                    # da medição: release() com payload pendente fecha a conexão em vez de
+                    # devolvê-la ao pool keep-alive
+                    try:
+                        async for _ in response.content.iter_any():
+                            pass
+                    except Exception:
+                        pass  # Não é crítico para o teste
+                    status_code, response_headers = response.status, response.headers
+            
+            result = APITestResult(
+                endpoint=endpoint,
+                method="GET",
+                status_code=status_code,
+                response_time=response_time,
+                headers=_kept_headers(response_headers),
+                rate_limit_info=self._extract_rate_limit_info(response_headers),
+                timestamp=datetime.now()
+            )
+            
+            if result.rate_limit_info:
+                self._last_rate_info = result.rate_limit_info
+            
+            self._record(result)
+            return result
+            
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.perf_counter() - start_time
             
             result = APITestResult(
                 endpoint=endpoint,
@@ -143,36 +265,64 @@ class CSFloatAPITester:
                 error=str(e)
             )
             
+            self._record(result)
             return result
     
+    def _schedule_next(self, result: APITestResult, fallback_delay: float):
+        """Calcula quando a próxima requisição pode sair a partir dos headers de rate limit"""
+        now = time.monotonic()
+        rate_info = result.rate_limit_info
+        
+        if result.status_code == 429:
+            retry_after = rate_info.get('retry_after')
+            wait = retry_after if isinstance(retry_after, int) else 1
+            logger.warning(f"⏳ 429 recebido - Retry-After: {wait}s")
+        elif isinstance(rate_info.get('remaining'), int) and isinstance(rate_info.get('reset'), int):
+            # Espalha as requisições restantes até o reset da janela
+            reset = rate_info['reset']
+            until_reset = reset - time.time() if reset > 1_000_000_000 else reset  # epoch ou segundos
+            wait = max(0.0, until_reset) / max(rate_info['remaining'], 1)
+        else:
+            # Sem headers de rate limit: mantém o delay configurado
+            wait = fallback_delay
+        
+        self._next_allowed = now + wait
+    
+    async def _wait_turn(self):
+        """Aguarda até o horário liberado pelo último _schedule_next"""
+        wait = self._next_allowed - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
     async def test_listings_endpoint(self, num_requests: int = 10, delay: float = 1.0) -> List[APITestResult]:
         """Testa o endpoint de listings"""
-        logger.info(f"🧪 Testando endpoint listings - {num_requests} requisições com {delay}s delay")
+        logger.info(f"🧪 Testando endpoint listings - {num_requests} requisições "
+                    f"(ritmo pelos headers de rate limit, {delay}s sem eles)")
         
         results = []
         
+        # URL e params montados uma vez: a cada iteração só a página muda
+        # (seguro porque as requisições são sequenciais)
+        url = f"{self.base_url}/listings"
+        params = {
+            'page': 0,
+            'limit': 10,  # Pequeno para não sobrecarregar
+            'sort_by': 'most_recent'
+        }
+        
         for i in range(num_requests):
-            if i > 0:
-                await asyncio.sleep(delay)
+            await self._wait_turn()
             
-            params = {
-                'page': i,
-                'limit': 10,  # Pequeno para não sobrecarregar
-                'sort_by': 'most_recent'
-            }
-            
-            result = await self._make_request('listings', params)
+            params['page'] = i
+            result = await self._make_request_url('listings', url, params)
             results.append(result)
-            self.results.append(result)
-            
-            # Log do progresso
-            status_emoji = "✅" if result.status_code == 200 else "❌"
-            rate_info = result.rate_limit_info
-            remaining = rate_info.get('remaining', 'N/A')
+            self._schedule_next(result, delay)
             
-            logger.info(f"{status_emoji} Req {i+1}/{num_requests}: "
-                       f"{result.status_code} ({result.response_time:.2f}s) "
-                       f"- Remaining: {remaining}")
+            # Log do progresso (formatação %-style: só acontece se o nível INFO estiver ativo)
+            logger.info("%s Req %d/%d: %d (%.2fs) - Remaining: %s",
+                        "✅" if result.status_code == 200 else "❌", i + 1, num_requests,
+                        result.status_code, result.response_time,
+                        result.rate_limit_info.get('remaining', 'N/A'))
             
             # Parar se hit rate limit
             if result.status_code == 429:
@@ -181,36 +331,41 @@ class CSFloatAPITester:
         
         return results
     
-    async def test_burst_requests(self, num_requests: int = 5) -> List[APITestResult]:
-        """Testa requisições em rajada (sem delay)"""
+    async def test_burst_requests(self, num_requests: int = 5, concurrency: int = 10) -> List[APITestResult]:
+        """Testa requisições em rajada (sem delay, no máximo `concurrency` em voo)"""
         logger.info(f"💥 Testando requisições em rajada - {num_requests} simultâneas")
         
-        tasks = []
+        # O semáforo segura as excedentes antes do cronômetro de _make_request começar,
+        # então a fila do lado do cliente não entra na latência medida
+        sem = asyncio.Semaphore(concurrency)
         
-        for i in range(num_requests):
-            params = {
+        async def _bounded(params: Dict[str, Any]) -> APITestResult:
+            async with sem:
+                return await self._make_request('listings', params)
+        
+        tasks = [
+            asyncio.create_task(_bounded({
                 'page': 0,
                 'limit': 5,
                 'sort_by': 'most_recent'
-            }
-            task = self._make_request('listings', params)
-            tasks.append(task)
-        
-        # Executar todas simultaneamente
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            }))
+            for _ in range(num_requests)
+        ]
         
-        # Processar resultados
+        # Processar resultados na ordem em que terminam
         valid_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, APITestResult):
-                valid_results.append(result)
-                self.results.append(result)
-                
-                status_emoji = "✅" if result.status_code == 200 else "❌"
-                logger.info(f"{status_emoji} Burst {i+1}: "
-                           f"{result.status_code} ({result.response_time:.2f}s)")
-            else:
-                logger.error(f"❌ Burst {i+1}: Exceção - {result}")
+        for i, next_done in enumerate(asyncio.as_completed(tasks)):
+            try:
+                result = await next_done
+            except Exception as e:
+                logger.error(f"❌ Burst {i+1}: Exceção - {e}")
+                continue
+            
+            valid_results.append(result)
+            
+            logger.info("%s Burst %d: %d (%.2fs)",
+                        "✅" if result.status_code == 200 else "❌", i + 1,
+                        result.status_code, result.response_time)
         
         return valid_results
     
@@ -225,59 +380,54 @@ class CSFloatAPITester:
             ('items/float', {'inspect_url': 'steam://rungame/730/76561202255233023/+csgo_econ_action_preview%20S76561198084749846A35418888340D16085414346054800717'}),
         ]
         
-        results = []
+        # Endpoints independentes: disparados juntos (o limit_per_host do connector limita o paralelismo)
+        gathered = await asyncio.gather(
+            *(self._make_request(endpoint, params) for endpoint, params in test_endpoints),
+            return_exceptions=True
+        )
         
-        for endpoint, params in test_endpoints:
-            result = await self._make_request(endpoint, params)
+        results = []
+        for (endpoint, _), result in zip(test_endpoints, gathered):
+            if not isinstance(result, APITestResult):
+                logger.error(f"❌ {endpoint}: Exceção - {result}")
+                continue
+            
             results.append(result)
-            self.results.append(result)
             
             status_emoji = "✅" if result.status_code == 200 else "❌"
-            logger.info(f"{status_emoji} {endpoint}: {result.status_code}")
-            
-            # Delay entre diferentes endpoints
-            await asyncio.sleep(1.0)
+            logger.info(f"{status_emoji} {endpoint}: {result.status_code} ({result.response_time:.2f}s)")
         
         return results
     
     def generate_report(self) -> Dict[str, Any]:
-        """Gera relatório detalhado dos testes"""
-        if not self.results:
+        """Gera relatório detalhado dos testes (a partir dos agregados; detalhes no JSONL)"""
+        if not self._n_total:
             return {"error": "Nenhum resultado para analisar"}
         
         # Estatísticas básicas
-        total_requests = len(self.results)
-        successful_requests = len([r for r in self.results if r.status_code == 200])
+        total_requests = self._n_total
+        successful_requests = self._codes[200]
         failed_requests = total_requests - successful_requests
         
         # Análise de rate limiting
-        rate_limited = len([r for r in self.results if r.status_code == 429])
+        rate_limited = self._codes[429]
         
         # Análise de timing
-        response_times = [r.response_time for r in self.results if r.response_time > 0]
-        avg_response_time = sum(response_times) / len(response_times) if response_times else 0
+        avg_response_time = self._rt_sum / self._rt_n if self._rt_n else 0
         
         # Rate limit info do último resultado com dados
-        last_rate_info = {}
-        for result in reversed(self.results):
-            if result.rate_limit_info:
-                last_rate_info = result.rate_limit_info
-                break
+        last_rate_info = self._last_rate_info
         
         # Análise temporal
-        if len(self.results) >= 2:
-            start_time = self.results[0].timestamp
-            end_time = self.results[-1].timestamp
-            duration = (end_time - start_time).total_seconds()
+        if total_requests >= 2:
+            duration = (self._last_ts - self._first_ts).total_seconds()
             requests_per_second = total_requests / duration if duration > 0 else 0
         else:
             duration = 0
             requests_per_second = 0
         
         # Códigos de status
-        status_codes = {}
-        for result in self.results:
-            status_codes[result.status_code] = status_codes.get(result.status_code, 0) + 1
+        status_codes = dict(self._codes)
         
         report = {
             "summary": {
@@ -291,47 +441,42 @@ class CSFloatAPITester:
             },
             "performance": {
                 "avg_response_time": avg_response_time,
-                "min_response_time": min(response_times) if response_times else 0,
-                "max_response_time": max(response_times) if response_times else 0
+                "min_response_time": self._rt_min if self._rt_n else 0,
+                "max_response_time": self._rt_max
             },
             "rate_limiting": {
                 "last_known_limit": last_rate_info.get('limit'),
                 "last_known_remaining": last_rate_info.get('remaining'),
-                "detected_headers": list(set([
-                    header for result in self.results 
-                    for header in result.rate_limit_info.keys()
-                ]))
+                "detected_headers": list(self._detected_headers)
             },
             "status_codes": status_codes,
-            "recommendations": self._generate_recommendations(),
+            "results_file": str(self.results_path) if self.results_path else None,
             "timestamp": datetime.now().isoformat()
         }
         
+        # Recomendações reaproveitam as métricas já calculadas acima
+        report["recommendations"] = self._generate_recommendations(report["summary"], avg_response_time)
+        
         return report
     
-    def _generate_recommendations(self) -> List[str]:
-        """Gera recomendações baseadas nos resultados"""
+    def _generate_recommendations(self, summary: Dict[str, Any], avg_time: float) -> List[str]:
+        """Gera recomendações a partir do resumo já calculado em generate_report"""
         recommendations = []
         
-        if not self.results:
+        if not summary["total_requests"]:
             return ["Nenhum teste executado"]
         
         # Análise de rate limiting
-        rate_limited = len([r for r in self.results if r.status_code == 429])
+        rate_limited = summary["rate_limited_requests"]
         if rate_limited > 0:
             recommendations.append(f"⚠️ {rate_limited} requisições foram rate limited - reduza a frequência")
         
         # Análise de response time
-        response_times = [r.response_time for r in self.results if r.response_time > 0]
-        if response_times:
-            avg_time = sum(response_times) / len(response_times)
-            if avg_time > 2.0:
-                recommendations.append(f"🐌 Tempo de resposta alto ({avg_time:.2f}s) - considere cache")
+        if avg_time > 2.0:
+            recommendations.append(f"🐌 Tempo de resposta alto ({avg_time:.2f}s) - considere cache")
         
         # Análise de success rate
-        total = len(self.results)
-        successful = len([r for r in self.results if r.status_code == 200])
-        success_rate = (successful / total * 100) if total > 0 else 0
+        success_rate = summary["success_rate"]
         
         if success_rate < 90:
             recommendations.append(f"❌ Taxa de sucesso baixa ({success_rate:.1f}%) - verifique API key")
@@ -339,11 +484,7 @@ class CSFloatAPITester:
             recommendations.append("✅ Taxa de sucesso excelente - configuração otimizada")
         
         # Rate limit específico
-        last_rate_info = {}
-        for result in reversed(self.results):
-            if result.rate_limit_info:
-                last_rate_info = result.rate_limit_info
-                break
+        last_rate_info = self._last_rate_info
         
         if last_rate_info.get('remaining'):
             remaining = last_rate_info['remaining']
@@ -364,6 +505,7 @@ async def main():
     parser.add_argument("--requests", type=int, default=20, help="Número de requisições para teste")
     parser.add_argument("--delay", type=float, default=1.0, help="Delay entre requisições")
     parser.add_argument("--output", type=str, default="api_test_report.json", help="Arquivo de saída")
+    parser.add_argument("--http2", action="store_true", help="Usar httpx com HTTP/2 (multiplexação)")
     
     args = parser.parse_args()
     
@@ -376,7 +518,10 @@ async def main():
     logger.info("🚀 Iniciando teste de limites da API CSFloat")
     logger.info(f"📊 Configuração: {args.requests} requisições, {args.delay}s delay")
     
-    async with CSFloatAPITester(api_key) as tester:
+    # Resultados individuais em JSONL ao lado do relatório (pandas.read_json(path, lines=True))
+    results_file = Path(args.output).with_suffix('.jsonl')
+    
+    async with CSFloatAPITester(api_key, http2=args.http2, results_path=results_file) as tester:
         try:
             # Teste 1: Requisições sequenciais
             await tester.test_listings_endpoint(args.requests, args.delay)
@@ -404,8 +549,15 @@ async def main():
     
     # Salvar relatório
     output_file = Path(args.output)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+    if ORJSON_AVAILABLE:
+        output_file.write_bytes(orjson.dumps(
+            report,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
     
     # Mostrar resumo
     summary = report['summary']
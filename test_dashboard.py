@@ -3,6 +3,7 @@
 Script para testar o dashboard localmente antes do deploy
 """
 
+import importlib.util
 import subprocess
 import sys
 import webbrowser
@@ -13,13 +14,11 @@ def test_dashboard():
     print("🧪 TESTE LOCAL DO DASHBOARD SKINLYTICS")
     print("=" * 50)
     
-    # Verificar se o streamlit está instalado
+    # Verificar se o streamlit está instalado (sem subir outro interpretador)
     try:
-        result = subprocess.run([sys.executable, "-c", "import streamlit"], 
-                              capture_output=True, text=True)
-        if result.returncode != 0:
+        if importlib.util.find_spec("streamlit") is None:
             print("❌ Streamlit não encontrado. Instalando...")
-            subprocess.run([sys.executable, "-m", "pip", "install", "streamlit"])
+            subprocess.run([sys.executable, "-m", "pip", "install", "streamlit"], check=True)
     except Exception as e:
         print(f"❌ Erro: {e}")
         return False
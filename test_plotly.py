@@ -9,22 +9,19 @@ try:
     from plotly.subplots import make_subplots
     print("✅ Plotly importado com sucesso!")
     
-    # Teste básico
-    import pandas as pd
+    # Teste básico (arrays NumPy direto no trace, sem passar por DataFrame)
     import numpy as np
     
     # Criar dados de teste
-    df = pd.DataFrame({
-        'x': np.random.randn(100),
-        'y': np.random.randn(100)
-    })
+    xs, ys = np.random.randn(100), np.random.randn(100)
     
-    # Criar gráfico
-    fig = px.scatter(df, x='x', y='y', title='Teste Plotly')
+    # Criar gráfico (WebGL)
+    fig = go.Figure(go.Scattergl(x=xs, y=ys, mode='markers'))
+    fig.update_layout(title='Teste Plotly')
     print("✅ Gráfico criado com sucesso!")
     
-    # Salvar como HTML para teste
-    fig.write_html("test_plotly.html")
+    # Salvar como HTML para teste (plotly.js via CDN: arquivo de KB em vez de ~3MB)
+    fig.write_html("test_plotly.html", include_plotlyjs='cdn')
     print("✅ Gráfico salvo como HTML!")
     
 except ImportError as e:
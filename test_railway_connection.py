@@ -4,9 +4,7 @@ Teste de conexão com Railway PostgreSQL
 """
 
 import os
-import psycopg2
 from sqlalchemy import create_engine, text
-import pandas as pd
 
 def test_railway_db():
     """Testa conexão com Railway PostgreSQL"""
@@ -19,8 +17,16 @@ def test_railway_db():
         return False
     
     try:
-        # Testar conexão
-        engine = create_engine(os.environ['DATABASE_URL'])
+        # Testar conexão (pool com pre-ping e keepalives TCP para o proxy do Railway
+        # não derrubar conexões ociosas)
+        engine = create_engine(
+            os.environ['DATABASE_URL'],
+            pool_size=5,
+            max_overflow=10,
+            pool_pre_ping=True,
+            pool_recycle=300,
+            connect_args={'keepalives': 1, 'keepalives_idle': 30, 'keepalives_interval': 10}
+        )
         
         with engine.connect() as conn:
             print("✅ Conexão estabelecida com sucesso!")
@@ -37,11 +43,16 @@ def test_railway_db():
             if tables:
                 print(f"📊 Tabelas encontradas: {tables}")
                 
-                # Verificar dados em cada tabela
+                # Verificar dados em cada tabela: estimativa das estatísticas do Postgres,
+                # uma única consulta em vez de um COUNT(*) (varredura completa) por tabela
+                result = conn.execute(text("""
+                    SELECT relname, n_live_tup
+                    FROM pg_stat_user_tables
+                    WHERE schemaname = 'public'
+                """))
+                live_tuples = dict(result.fetchall())
                 for table in tables:
-                    result = conn.execute(text(f"SELECT COUNT(*) FROM {table}"))
-                    count = result.fetchone()[0]
-                    print(f"  - {table}: {count:,} registros")
+                    print(f"  - {table}: {live_tuples.get(table, 0):,} registros (aprox.)")
             else:
                 print("⚠️ Nenhuma tabela encontrada")
                 print("💡 As tabelas serão criadas automaticamente no primeiro deploy")
@@ -9,10 +9,31 @@ import aiohttp
 import json
 import time
 from datetime import datetime
+from typing import Optional
+
+# Sessão única do módulo: conexões keep-alive reaproveitadas entre os testes,
+# sem handshake TCP+TLS novo a cada request (que distorcia o teste de rate limiting)
+_session: Optional[aiohttp.ClientSession] = None
+
+async def get_session() -> aiohttp.ClientSession:
+    """Retorna a sessão compartilhada, criando-a na primeira chamada"""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300)
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+async def close_session():
+    """Fecha a sessão compartilhada (chamado no fim de main)"""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
 
 async def test_pricempire_api():
     """Testa Pricempire API"""
     print("💰 Testando Pricempire API...")
+    session = await get_session()
     
     url = "https://api.pricempire.com/v2/getItems"
     params = {
@@ -21,24 +42,23 @@ async def test_pricempire_api():
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                print(f"   Status: {response.status}")
+        async with session.get(url, params=params) as response:
+            print(f"   Status: {response.status}")
+            
+            if response.status == 200:
+                data = await response.json()
+                print(f"   ✅ Sucesso! {len(data.get('data', []))} items retornados")
                 
-                if response.status == 200:
-                    data = await response.json()
-                    print(f"   ✅ Sucesso! {len(data.get('data', []))} items retornados")
-                    
-                    # Mostrar primeiro item como exemplo
-                    if data.get('data'):
-                        first_item = data['data'][0]
-                        print(f"   📝 Exemplo: {first_item.get('market_hash_name', 'N/A')}")
-                        print(f"      Preço: ${first_item.get('price', 'N/A')}")
-                    
-                    return True
-                else:
-                    print(f"   ❌ Erro HTTP: {response.status}")
-                    return False
+                # Mostrar primeiro item como exemplo
+                if data.get('data'):
+                    first_item = data['data'][0]
+                    print(f"   📝 Exemplo: {first_item.get('market_hash_name', 'N/A')}")
+                    print(f"      Preço: ${first_item.get('price', 'N/A')}")
+                
+                return True
+            else:
+                print(f"   ❌ Erro HTTP: {response.status}")
+                return False
                     
     except Exception as e:
         print(f"   ❌ Erro: {e}")
@@ -47,6 +67,7 @@ async def test_pricempire_api():
 async def test_steam_market_api():
     """Testa Steam Market API"""
     print("🎮 Testando Steam Market API...")
+    session = await get_session()
     
     # Testar com uma skin popular
     test_skin = "AK-47 | Redline (Field-Tested)"
@@ -59,25 +80,24 @@ async def test_steam_market_api():
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                print(f"   Status: {response.status}")
+        async with session.get(url, params=params) as response:
+            print(f"   Status: {response.status}")
+            
+            if response.status == 200:
+                data = await response.json()
+                print(f"   ✅ Sucesso! Dados retornados para {test_skin}")
                 
-                if response.status == 200:
-                    data = await response.json()
-                    print(f"   ✅ Sucesso! Dados retornados para {test_skin}")
-                    
-                    if data.get('success'):
-                        print(f"   📝 Preço médio: {data.get('median_price', 'N/A')}")
-                        print(f"      Volume: {data.get('volume', 'N/A')}")
-                        print(f"      Status: {data.get('success')}")
-                    else:
-                        print(f"   ⚠️ API retornou success=False")
-                    
-                    return True
+                if data.get('success'):
+                    print(f"   📝 Preço médio: {data.get('median_price', 'N/A')}")
+                    print(f"      Volume: {data.get('volume', 'N/A')}")
+                    print(f"      Status: {data.get('success')}")
                 else:
-                    print(f"   ❌ Erro HTTP: {response.status}")
-                    return False
+                    print(f"   ⚠️ API retornou success=False")
+                
+                return True
+            else:
+                print(f"   ❌ Erro HTTP: {response.status}")
+                return False
                     
     except Exception as e:
         print(f"   ❌ Erro: {e}")
@@ -86,6 +106,7 @@ async def test_steam_market_api():
 async def test_rate_limiting():
     """Testa rate limiting das APIs"""
     print("⏱️ Testando rate limiting...")
+    session = await get_session()
     
     # Testar Pricempire com múltiplas requests
     print("   Testando Pricempire (5 requests rápidos)...")
@@ -95,19 +116,18 @@ async def test_rate_limiting():
     
     for i in range(5):
         try:
-            async with aiohttp.ClientSession() as session:
-                url = "https://api.pricempire.com/v2/getItems"
-                params = {'game': 'cs2', 'limit': 1}
-                
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        success_count += 1
-                        print(f"      Request {i+1}: ✅")
-                    else:
-                        print(f"      Request {i+1}: ❌ HTTP {response.status}")
-                
-                # Pequeno delay entre requests
-                await asyncio.sleep(0.1)
+            url = "https://api.pricempire.com/v2/getItems"
+            params = {'game': 'cs2', 'limit': 1}
+            
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    success_count += 1
+                    print(f"      Request {i+1}: ✅")
+                else:
+                    print(f"      Request {i+1}: ❌ HTTP {response.status}")
+            
+            # Pequeno delay entre requests
+            await asyncio.sleep(0.1)
                 
         except Exception as e:
             print(f"      Request {i+1}: ❌ Erro: {e}")
@@ -125,17 +145,20 @@ async def main():
     
     results = {}
     
-    # Teste 1: Pricempire API
-    results['pricempire'] = await test_pricempire_api()
-    print()
-    
-    # Teste 2: Steam Market API
-    results['steam_market'] = await test_steam_market_api()
-    print()
-    
-    # Teste 3: Rate Limiting
-    results['rate_limiting'] = await test_rate_limiting()
-    print()
+    try:
+        # Teste 1: Pricempire API
+        results['pricempire'] = await test_pricempire_api()
+        print()
+        
+        # Teste 2: Steam Market API
+        results['steam_market'] = await test_steam_market_api()
+        print()
+        
+        # Teste 3: Rate Limiting
+        results['rate_limiting'] = await test_rate_limiting()
+        print()
+    finally:
+        await close_session()
     
     # Resumo dos resultados
     print("📊 RESUMO DOS TESTES")
@@ -0,0 +1,56 @@
+"""
+Testes do registro de resultados do test_api_limits (JSONL + agregados)
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+pytest.importorskip("aiohttp")
+multidict = pytest.importorskip("multidict")
+
+from test_api_limits import APITestResult, CSFloatAPITester, _kept_headers
+
+
+def test_record_accepts_istr_header_keys(tmp_path):
+    """Headers do aiohttp (CIMultiDict com chaves istr) são gravados sem erro"""
+    response_headers = multidict.CIMultiDict({
+        multidict.istr('Content-Length'): '512',
+        multidict.istr('Retry-After'): '3',
+        'X-RateLimit-Remaining': '42',
+        'Content-Type': 'application/json',
+    })
+
+    tester = CSFloatAPITester(api_key='', results_path=tmp_path / 'results.jsonl')
+    tester._jsonl = open(tester.results_path, 'ab')
+    try:
+        result = APITestResult(
+            endpoint='listings',
+            method='GET',
+            status_code=200,
+            response_time=0.1,
+            headers=_kept_headers(response_headers),
+            rate_limit_info=tester._extract_rate_limit_info(response_headers),
+            timestamp=datetime.now()
+        )
+        tester._record(result)
+    finally:
+        tester._jsonl.close()
+
+    assert all(type(k) is str for k in result.headers)
+    assert tester._codes == {200: 1}
+
+    lines = tester.results_path.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record['status_code'] == 200
+    assert record['headers'] == {
+        'Content-Length': '512',
+        'Retry-After': '3',
+        'X-RateLimit-Remaining': '42',
+    }
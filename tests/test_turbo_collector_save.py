@@ -0,0 +1,124 @@
+"""
+Testes da gravação em lote do turbo_collector (SQLite, sem rede)
+"""
+
+import importlib
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+pytest.importorskip("httpx")
+
+# Tabela listings como o scale_collection.py cria (item_name e price_usd NOT NULL)
+_SCALE_COLLECTION_LISTINGS_DDL = """
+    CREATE TABLE listings (
+        id TEXT PRIMARY KEY,
+        item_name TEXT NOT NULL,
+        price_usd REAL NOT NULL,
+        float_value REAL,
+        paint_seed INTEGER,
+        paint_index INTEGER,
+        def_index INTEGER,
+        wear_name TEXT,
+        rarity INTEGER,
+        collection TEXT,
+        stickers TEXT,
+        seller_id TEXT,
+        seller_username TEXT,
+        seller_stats TEXT,
+        created_at_csfloat TEXT,
+        collected_at TEXT DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+def _listing(listing_id: str, price: int = 1234) -> dict:
+    return {
+        'id': listing_id,
+        'price': price,
+        'created_at': '2025-08-01T00:00:00Z',
+        'item': {
+            'market_hash_name': 'AK-47 | Redline (Field-Tested)',
+            'item_name': 'AK-47 | Redline',
+            'wear_name': 'Field-Tested',
+            'float_value': 0.25,
+            'def_index': 7,
+            'paint_index': 282,
+            'stickers': [],
+        },
+        'seller': {'steam_id': '7656', 'username': 'seller', 'statistics': {}},
+    }
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Diretório de trabalho temporário: data/skins.db e o log do coletor ficam fora do repo"""
+    (tmp_path / 'data').mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def turbo_collector(workdir):
+    return importlib.import_module('turbo_collector')
+
+
+@pytest.fixture
+def collector(turbo_collector):
+    collector = turbo_collector.TurboCollector(api_key='test')
+    yield collector
+    collector.conn.close()
+
+
+def test_in_batch_duplicates_are_skipped(collector):
+    new, duplicates = collector.save_listings_batch([_listing('a'), _listing('a'), _listing('b')])
+
+    assert (new, duplicates) == (2, 1)
+    assert collector.conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0] == 2
+
+
+def test_already_stored_id_counts_as_duplicate(collector):
+    assert collector.save_listings_batch([_listing('a')]) == (1, 0)
+
+    new, duplicates = collector.save_listings_batch([_listing('a'), _listing('c')])
+
+    assert (new, duplicates) == (1, 1)
+    assert collector.conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0] == 2
+
+
+def test_empty_batch(collector):
+    assert collector.save_listings_batch([]) == (0, 0)
+
+
+def test_prices_are_stored_in_dollars(collector):
+    collector.save_listings_batch([_listing('a', price=1234)])
+
+    (price_usd,) = collector.conn.execute("SELECT price_usd FROM listings WHERE id = 'a'").fetchone()
+    assert price_usd == pytest.approx(12.34)
+
+
+def test_legacy_price_usd_table(workdir, turbo_collector):
+    """Banco criado antes pelo scale_collection: o coletor grava no schema existente"""
+    conn = sqlite3.connect(workdir / 'data' / 'skins.db')
+    conn.execute(_SCALE_COLLECTION_LISTINGS_DDL)
+    conn.execute(
+        "INSERT INTO listings (id, item_name, price_usd) VALUES ('old', 'AK-47 | Redline', 10.0)"
+    )
+    conn.commit()
+    conn.close()
+
+    collector = turbo_collector.TurboCollector(api_key='test')
+    try:
+        new, duplicates = collector.save_listings_batch(
+            [_listing('old'), _listing('x', price=500), _listing('x', price=500)]
+        )
+
+        assert (new, duplicates) == (1, 2)
+        rows = collector.conn.execute("SELECT id, price_usd FROM listings ORDER BY id").fetchall()
+        assert rows == [('old', 10.0), ('x', 5.0)]
+    finally:
+        collector.conn.close()
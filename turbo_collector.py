@@ -4,7 +4,8 @@
 Versão otimizada para coletar o máximo de dados possível
 """
 import asyncio
-import aiohttp
+import collections
+import httpx
 import sqlite3
 import json
 import time
@@ -12,7 +13,25 @@ from datetime import datetime
 import argparse
 import logging
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _dumps(obj) -> str:
+    """Serializa em JSON (orjson quando disponível)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+def _loads(raw: bytes):
+    """Decodifica o corpo da resposta direto dos bytes (orjson quando disponível)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 # Configuração de logging
 logging.basicConfig(
@@ -24,7 +43,36 @@ logging.basicConfig(
     ]
 )
 
+# INSERTs do writer: mesmo texto SQL a cada lote, então o sqlite3 reaproveita o
+# statement já compilado do cache da conexão
+_INSERT_LISTING_SQL = """
+    INSERT OR IGNORE INTO listings 
+    (id, item_name, price_usd, float_value, paint_seed, paint_index, 
+     def_index, wear_name, rarity, collection, stickers, seller_id, 
+     seller_username, seller_stats, created_at_csfloat)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_SKIN_SQL = """
+    INSERT OR IGNORE INTO skins 
+    (market_hash_name, item_name, wear_name, def_index, paint_index)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
 class TurboCollector:
+    # Controle AIMD de concorrência: +0.5 a cada AIMD_WINDOW sucessos, metade em 429/5xx
+    AIMD_MIN = 1.0
+    AIMD_MAX = 10.0  # Streams simultâneos na conexão HTTP/2
+    AIMD_WINDOW = 10
+    MAX_RETRIES = 3
+    
+    # Gate preventivo de rate limit (a cota do CSFloat é por API key, não por conexão)
+    RPM_DEFAULT = 60
+    RPM_WINDOW = 60.0
+    
+    # Objetos criados por _create_schema (checados no sqlite_master antes do DDL)
+    SCHEMA_OBJECTS = ('skins', 'listings', 'idx_listings_hash', 'idx_listings_time')
+    
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://csfloat.com/api/v1"
@@ -32,58 +80,186 @@ class TurboCollector:
         self.db_path = 'data/skins.db'
         self.logger = logging.getLogger(__name__)
         
-        # Estatísticas
-        self.stats = {
-            'total_collected': 0,
-            'total_requests': 0,
-            'failed_requests': 0,
-            'start_time': time.time(),
-            'duplicates_skipped': 0
-        }
+        # Estatísticas (atributos simples: atualizados a cada requisição/lote)
+        self.total_collected = 0
+        self.total_requests = 0
+        self.failed_requests = 0
+        self.start_time = time.time()
+        self.duplicates_skipped = 0
+        
+        # Estado do AIMD: requisições em voo limitadas por int(_current_c)
+        self._current_c = 3.0
+        self._in_flight = 0
+        self._ok_streak = 0
+        self._slots = asyncio.Condition()
         
-        # Cache para evitar duplicatas
-        self.existing_listings = set()
-        self.load_existing_listings()
+        # Janela deslizante com os instantes das requisições do último minuto
+        self._request_times: collections.deque = collections.deque()
+        self._rpm_limit = self.RPM_DEFAULT  # Limite anunciado pelo servidor
+        self._rpm = self.RPM_DEFAULT        # Limite efetivo do gate
+        
+        # Uma conexão para toda a coleta; transações controladas manualmente (BEGIN/COMMIT).
+        # check_same_thread=False: as escritas rodam na thread do writer (_db_writer)
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")  # fsync só no checkpoint do WAL
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        self.conn.execute("PRAGMA cache_size=-65536")    # 64 MB
+        self._schema_ready = False
+        self._create_schema()
+        
+        # Fila de páginas para o writer único do SQLite (criado em run_turbo_collection)
+        self.write_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+        self._writer_task = None
+        
+        # IDs já enfileirados no ciclo atual (as estratégias de sort se sobrepõem)
+        self._seen_ids: set = set()
+
     
-    def load_existing_listings(self):
-        """Carrega IDs dos listings existentes para evitar duplicatas"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM listings")
-            self.existing_listings = {row[0] for row in cursor.fetchall()}
-            conn.close()
-            self.logger.info(f"Cache carregado: {len(self.existing_listings)} listings existentes")
-        except Exception as e:
-            self.logger.warning(f"Erro ao carregar cache: {e}")
-            self.existing_listings = set()
+    def _create_schema(self):
+        """Cria as tabelas (uma vez, na inicialização)"""
+        if self._schema_ready:
+            return
+        
+        # Banco já existente: uma consulta ao catálogo no lugar de quatro DDLs
+        placeholders = ','.join('?' * len(self.SCHEMA_OBJECTS))
+        (found,) = self.conn.execute(
+            f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})",
+            self.SCHEMA_OBJECTS
+        ).fetchone()
+        if found == len(self.SCHEMA_OBJECTS):
+            self._schema_ready = True
+            return
+        
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS skins (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                market_hash_name TEXT UNIQUE,
+                item_name TEXT,
+                wear_name TEXT,
+                def_index INTEGER,
+                paint_index INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS listings (
+                id TEXT PRIMARY KEY,
+                item_name TEXT,
+                price_usd REAL,
+                float_value REAL,
+                paint_seed INTEGER,
+                paint_index INTEGER,
+                def_index INTEGER,
+                wear_name TEXT,
+                rarity INTEGER,
+                collection TEXT,
+                stickers TEXT,
+                seller_id TEXT,
+                seller_username TEXT,
+                seller_stats TEXT,
+                created_at_csfloat TEXT,
+                collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Filtros usados pelos dashboards (por item e por data de coleta)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_listings_hash ON listings(item_name, wear_name)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_listings_time ON listings(collected_at)")
+        self._schema_ready = True
     
     async def create_session(self):
-        """Cria sessão HTTP otimizada"""
-        connector = aiohttp.TCPConnector(
-            limit=50,  # Máximo de conexões
-            limit_per_host=10,  # Por host
-            ttl_dns_cache=300,
-            use_dns_cache=True,
+        """Cria sessão HTTP otimizada (HTTP/2: requisições multiplexadas numa conexão TLS)"""
+        limits = httpx.Limits(
+            max_connections=50,  # Máximo de conexões
+            max_keepalive_connections=20
         )
         
-        timeout = aiohttp.ClientTimeout(total=30, connect=10)
+        timeout = httpx.Timeout(30.0, connect=10.0)
         
         headers = {
             'Authorization': self.api_key,
             'User-Agent': 'Skinlytics-TurboCollector/1.0'
         }
         
-        self.session = aiohttp.ClientSession(
-            connector=connector,
+        self.session = httpx.AsyncClient(
+            http2=True,
+            limits=limits,
             timeout=timeout,
             headers=headers
         )
         
-        self.logger.info("Sessão HTTP criada com otimizações")
+        self.logger.info("Sessão HTTP/2 criada com otimizações")
+    
+    async def _acquire_slot(self):
+        """Aguarda uma vaga dentro do limite de concorrência atual"""
+        async with self._slots:
+            await self._slots.wait_for(lambda: self._in_flight < int(self._current_c))
+            self._in_flight += 1
+    
+    async def _release_slot(self):
+        """Libera a vaga e acorda quem está esperando"""
+        async with self._slots:
+            self._in_flight -= 1
+            self._slots.notify_all()
+    
+    def _on_success(self, headers):
+        """Aumento aditivo: a cada AIMD_WINDOW sucessos a concorrência sobe 0.5"""
+        # Cota zerada: não aumenta mesmo com sucesso
+        if headers.get('X-RateLimit-Remaining') == '0':
+            return
+        
+        self._ok_streak += 1
+        if self._ok_streak >= self.AIMD_WINDOW:
+            self._ok_streak = 0
+            self._current_c = min(self.AIMD_MAX, self._current_c + 0.5)
+    
+    def _on_backoff(self):
+        """Redução multiplicativa da concorrência após 429/5xx"""
+        self._ok_streak = 0
+        self._current_c = max(self.AIMD_MIN, self._current_c * 0.5)
+    
+    async def _wait_if_throttled(self):
+        """Bloqueia antes do envio se a janela do último minuto já atingiu o limite de RPM"""
+        while True:
+            now = time.monotonic()
+            while self._request_times and now - self._request_times[0] >= self.RPM_WINDOW:
+                self._request_times.popleft()
+            
+            if len(self._request_times) < self._rpm:
+                self._request_times.append(now)
+                return
+            
+            await asyncio.sleep(self.RPM_WINDOW - (now - self._request_times[0]))
+    
+    def _tune_rpm(self, headers):
+        """Ajusta o limite de RPM pelos headers X-RateLimit-* do CSFloat (se presentes)"""
+        try:
+            limit = headers.get('X-RateLimit-Limit')
+            if limit is not None:
+                self._rpm_limit = max(1, int(limit))
+            self._rpm = self._rpm_limit
+            
+            # Cota restante menor que a janela local: o servidor conta requisições que
+            # não vimos (outro processo com a mesma key), então encolhe o limite
+            remaining = headers.get('X-RateLimit-Remaining')
+            if remaining is not None:
+                self._rpm = max(1, min(self._rpm, len(self._request_times) + int(remaining)))
+        except ValueError:
+            pass
+    
+    @staticmethod
+    def _retry_after(headers) -> float:
+        """Segundos de espera indicados pelo servidor (Retry-After), 1s se ausente"""
+        try:
+            return float(headers.get('Retry-After', 1))
+        except ValueError:
+            return 1.0
     
     async def get_listings_page(self, page: int, sort_by: str = 'most_recent', **params) -> List[Dict]:
-        """Coleta uma página de listings"""
+        """Coleta uma página de listings (com retry em 429/5xx respeitando Retry-After)"""
         url = f"{self.base_url}/listings"
         
         query_params = {
@@ -93,12 +269,17 @@ class TurboCollector:
             **params
         }
         
-        try:
-            async with self.session.get(url, params=query_params) as response:
-                self.stats['total_requests'] += 1
+        for attempt in range(self.MAX_RETRIES + 1):
+            await self._wait_if_throttled()
+            await self._acquire_slot()
+            try:
+                response = await self.session.get(url, params=query_params)
+                self.total_requests += 1
+                self._tune_rpm(response.headers)
                 
-                if response.status == 200:
-                    data = await response.json()
+                if response.status_code == 200:
+                    data = _loads(response.content)
+                    self._on_success(response.headers)
                     
                     # CSFloat retorna {"data": [...]}
                     if isinstance(data, dict) and 'data' in data:
@@ -111,135 +292,132 @@ class TurboCollector:
                     
                     return listings
                 
-                elif response.status == 429:
-                    # Rate limit - aguardar mais tempo
-                    self.logger.warning("Rate limit atingido, aguardando...")
-                    await asyncio.sleep(10)
-                    return []
+                elif response.status_code == 429 or response.status_code >= 500:
+                    # Rate limit / servidor sobrecarregado: reduz a concorrência e tenta de novo
+                    retry_after = self._retry_after(response.headers)
+                    self._on_backoff()
+                    self.logger.warning(
+                        f"HTTP {response.status_code} (página {page}, {sort_by}) - concorrência "
+                        f"{self._current_c:.1f}, nova tentativa em {retry_after:.0f}s"
+                    )
                 
                 else:
-                    self.logger.error(f"Erro {response.status}: {await response.text()}")
-                    self.stats['failed_requests'] += 1
+                    self.logger.error(f"Erro {response.status_code}: {response.text}")
+                    self.failed_requests += 1
                     return []
                     
-        except Exception as e:
-            self.logger.error(f"Erro na requisição: {e}")
-            self.stats['failed_requests'] += 1
-            return []
+            except Exception as e:
+                self.logger.error(f"Erro na requisição: {e}")
+                self.failed_requests += 1
+                return []
+            finally:
+                await self._release_slot()
+            
+            # Última tentativa: desiste na hora em vez de dormir o Retry-After à toa
+            if attempt == self.MAX_RETRIES:
+                break
+            
+            # Espera fora da vaga, para não segurar a concorrência durante o Retry-After
+            await asyncio.sleep(retry_after)
+        
+        self.logger.error(f"Página {page} ({sort_by}) descartada após {self.MAX_RETRIES} tentativas")
+        self.failed_requests += 1
+        return []
     
-    def save_listings_batch(self, listings: List[Dict]):
-        """Salva lote de listings no banco"""
+    def save_listings_batch(self, listings: List[Dict]) -> Tuple[int, int]:
+        """Salva lote de listings no banco (executemany numa única transação); retorna (novos, duplicatas)"""
+        # Roda na thread do writer: os contadores são somados por _db_writer, no event loop
         if not listings:
-            return 0
+            return 0, 0
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Pré-filtro: IDs repetidos dentro do lote saem antes de montar as linhas
+        unique = list({listing.get('id'): listing for listing in listings}.values())
+        batch_duplicates = len(listings) - len(unique)
         
-        # Verificar se tabelas existem
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS skins (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                market_hash_name TEXT UNIQUE,
-                item_name TEXT,
-                wear_name TEXT,
-                def_index INTEGER,
-                paint_index INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        # Deduplicação no SQLite: INSERT OR IGNORE sobre a PRIMARY KEY (id) descarta
+        # listings já gravados, sem manter todos os IDs em memória
         
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS listings (
-                id TEXT PRIMARY KEY,
-                item_name TEXT,
-                price_usd REAL,
-                float_value REAL,
-                paint_seed INTEGER,
-                paint_index INTEGER,
-                def_index INTEGER,
-                wear_name TEXT,
-                rarity INTEGER,
-                collection TEXT,
-                stickers TEXT,
-                seller_id TEXT,
-                seller_username TEXT,
-                seller_stats TEXT,
-                created_at_csfloat TEXT,
-                collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        listing_rows = []
+        skin_rows = []
         
-        new_count = 0
-        
-        for listing in listings:
+        for listing in unique:
             try:
-                listing_id = listing.get('id')
-                
-                # Pular se já existe
-                if listing_id in self.existing_listings:
-                    self.stats['duplicates_skipped'] += 1
-                    continue
+                item = listing.get('item') or {}
+                seller = listing.get('seller') or {}
                 
-                item = listing.get('item', {})
-                seller = listing.get('seller', {})
+                # Campos reaproveitados na linha da skin
+                item_name = item.get('item_name', '')
+                wear_name = item.get('wear_name', '')
+                def_index = item.get('def_index')
+                paint_index = item.get('paint_index')
                 
-                # Dados do listing
-                data = {
-                    'id': listing_id,
-                    'item_name': item.get('item_name', ''),
-                    'price_usd': listing.get('price', 0) / 100.0,  # CSFloat usa centavos
-                    'float_value': item.get('float_value'),
-                    'paint_seed': item.get('paint_seed'),
-                    'paint_index': item.get('paint_index'),
-                    'def_index': item.get('def_index'),
-                    'wear_name': item.get('wear_name', ''),
-                    'rarity': item.get('rarity'),
-                    'collection': item.get('collection', ''),
-                    'stickers': json.dumps(item.get('stickers', [])),
-                    'seller_id': seller.get('steam_id', ''),
-                    'seller_username': seller.get('username', ''),
-                    'seller_stats': json.dumps(seller.get('statistics', {})),
-                    'created_at_csfloat': listing.get('created_at', '')
-                }
-                
-                # Inserir listing
-                cursor.execute("""
-                    INSERT OR IGNORE INTO listings 
-                    (id, item_name, price_usd, float_value, paint_seed, paint_index, 
-                     def_index, wear_name, rarity, collection, stickers, seller_id, 
-                     seller_username, seller_stats, created_at_csfloat)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    data['id'], data['item_name'], data['price_usd'], data['float_value'],
-                    data['paint_seed'], data['paint_index'], data['def_index'], 
-                    data['wear_name'], data['rarity'], data['collection'], data['stickers'],
-                    data['seller_id'], data['seller_username'], data['seller_stats'],
-                    data['created_at_csfloat']
+                # Tupla direto na ordem de _INSERT_LISTING_SQL (sem dict intermediário)
+                listing_rows.append((
+                    listing.get('id'), item_name,
+                    listing.get('price', 0) / 100.0,  # CSFloat usa centavos
+                    item.get('float_value'), item.get('paint_seed'), paint_index, def_index,
+                    wear_name, item.get('rarity'), item.get('collection', ''),
+                    _dumps(item.get('stickers', [])),
+                    seller.get('steam_id', ''), seller.get('username', ''),
+                    _dumps(seller.get('statistics', {})),
+                    listing.get('created_at', '')
                 ))
                 
-                if cursor.rowcount > 0:
-                    new_count += 1
-                    self.existing_listings.add(listing_id)
-                
-                # Inserir skin (se nova)
+                # Skin (se nova)
                 market_hash_name = item.get('market_hash_name', '')
                 if market_hash_name:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO skins 
-                        (market_hash_name, item_name, wear_name, def_index, paint_index)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (
-                        market_hash_name, data['item_name'], data['wear_name'],
-                        data['def_index'], data['paint_index']
-                    ))
+                    skin_rows.append((market_hash_name, item_name, wear_name, def_index, paint_index))
                 
             except Exception as e:
-                self.logger.error(f"Erro ao salvar listing {listing.get('id', 'unknown')}: {e}")
+                self.logger.error("Erro ao preparar listing %s: %s", listing.get('id', 'unknown'), e)
         
-        conn.commit()
-        conn.close()
+        if not listing_rows:
+            return 0, batch_duplicates
+        
+        cursor = self.conn.cursor()
+        before = self.conn.total_changes
+        try:
+            cursor.execute("BEGIN")
+            cursor.executemany(_INSERT_LISTING_SQL, listing_rows)
+            new_count = self.conn.total_changes - before
+            
+            cursor.executemany(_INSERT_SKIN_SQL, skin_rows)
+            cursor.execute("COMMIT")
+        except Exception as e:
+            cursor.execute("ROLLBACK")
+            self.logger.error(f"Erro ao salvar lote de {len(listing_rows)} listings: {e}")
+            return 0, batch_duplicates
         
-        return new_count
+        return new_count, batch_duplicates + len(listing_rows) - new_count
+    
+    async def _db_writer(self):
+        """Consumidor único da write_queue: grava cada página numa thread, fora do event loop"""
+        while True:
+            batch = await self.write_queue.get()
+            try:
+                if batch is None:  # Sentinela de encerramento
+                    return
+                # Mesmo efeito do aiosqlite (thread dedicada + await) sem mais uma
+                # dependência: o commit/fsync nunca bloqueia o event loop
+                new_count, skipped = await asyncio.to_thread(self.save_listings_batch, batch)
+                self.total_collected += new_count
+                self.duplicates_skipped += skipped
+            except Exception as e:
+                self.logger.error(f"Erro no writer: {e}")
+            finally:
+                self.write_queue.task_done()
+    
+    async def _fetch_and_queue(self, page: int, strategy: Dict[str, Any]):
+        """Coleta uma página e a entrega ao writer assim que chega"""
+        listings = await self.get_listings_page(page, **strategy)
+        
+        # Sem await entre o filtro e o update: seguro no event loop único
+        fresh = [l for l in listings if l.get('id') not in self._seen_ids]
+        self._seen_ids.update(l.get('id') for l in fresh)
+        self.duplicates_skipped += len(listings) - len(fresh)
+        
+        if fresh:
+            await self.write_queue.put(fresh)
     
     async def turbo_collect_cycle(self, max_pages: int = 20, concurrent_workers: int = 5):
         """Executa um ciclo de coleta turbo"""
@@ -254,58 +432,54 @@ class TurboCollector:
             {'sort_by': 'highest_float'},
         ]
         
-        total_new = 0
+        collected_before = self.total_collected
+        self._seen_ids.clear()
         
-        for strategy in strategies:
-            self.logger.info(f"Estratégia: {strategy}")
-            
-            # Criar tasks para coleta paralela
-            tasks = []
-            for page in range(max_pages):
-                task = self.get_listings_page(page, **strategy)
-                tasks.append(task)
-            
-            # Executar em lotes para não sobrecarregar
-            batch_size = concurrent_workers
-            for i in range(0, len(tasks), batch_size):
-                batch = tasks[i:i + batch_size]
-                results = await asyncio.gather(*batch, return_exceptions=True)
-                
-                # Processar resultados
-                for result in results:
-                    if isinstance(result, list):
-                        new_count = self.save_listings_batch(result)
-                        total_new += new_count
-                        self.stats['total_collected'] += new_count
-                
-                # Pequena pausa entre lotes
-                await asyncio.sleep(1)
-            
-            # Pausa entre estratégias
-            await asyncio.sleep(2)
+        # Todas as páginas de todas as estratégias num único TaskGroup. Quem limita a
+        # concorrência é o AIMD de get_listings_page (_acquire_slot, até AIMD_MAX):
+        # um teto fixo aqui anularia o aumento aditivo. Cada página que termina libera
+        # a vaga na hora, sem barreira entre lotes; a conexão HTTP/2 é reaproveitada
+        # entre estratégias.
+        # Cada página vai para o writer assim que chega; o HTTP não espera o SQLite
+        async def guarded_fetch(page: int, strategy: Dict[str, Any]):
+            try:
+                await self._fetch_and_queue(page, strategy)
+            except Exception as e:
+                # Uma página com erro não cancela as demais tarefas do grupo
+                self.logger.error("Erro na página %s (%s): %s", page, strategy['sort_by'], e)
+        
+        async with asyncio.TaskGroup() as tg:
+            for strategy in strategies:
+                for page in range(max_pages):
+                    tg.create_task(guarded_fetch(page, strategy))
+        
+        # Esperar o writer gravar as páginas deste ciclo
+        await self.write_queue.join()
+        total_new = self.total_collected - collected_before
         
         self.logger.info(f"Ciclo concluído: +{total_new} novos listings")
         return total_new
     
     def print_stats(self):
         """Mostra estatísticas da coleta"""
-        runtime = time.time() - self.stats['start_time']
-        success_rate = ((self.stats['total_requests'] - self.stats['failed_requests']) / max(1, self.stats['total_requests'])) * 100
+        runtime = time.time() - self.start_time
+        success_rate = ((self.total_requests - self.failed_requests) / max(1, self.total_requests)) * 100
         
         print("\n" + "="*60)
         print("🚀 TURBO COLLECTOR - ESTATÍSTICAS")
         print("="*60)
         print(f"⏱️  Runtime: {runtime/60:.1f} minutos")
-        print(f"📦 Total Coletados: {self.stats['total_collected']:,}")
-        print(f"🔄 Total Requests: {self.stats['total_requests']:,}")
+        print(f"📦 Total Coletados: {self.total_collected:,}")
+        print(f"🔄 Total Requests: {self.total_requests:,}")
         print(f"✅ Taxa de Sucesso: {success_rate:.1f}%")
-        print(f"⚡ Duplicatas Ignoradas: {self.stats['duplicates_skipped']:,}")
-        print(f"🎯 Listings/min: {self.stats['total_collected']/(runtime/60):.1f}")
+        print(f"⚡ Duplicatas Ignoradas: {self.duplicates_skipped:,}")
+        print(f"🎯 Listings/min: {self.total_collected/(runtime/60):.1f}")
         print("="*60)
     
     async def run_turbo_collection(self, cycles: int = 5, interval: int = 300):
         """Executa coleta turbo contínua"""
         await self.create_session()
+        self._writer_task = asyncio.create_task(self._db_writer())
         
         self.logger.info(f"🚀 INICIANDO TURBO COLLECTOR - {cycles} ciclos")
         
@@ -325,8 +499,15 @@ class TurboCollector:
                     await asyncio.sleep(interval)
         
         finally:
+            if self._writer_task:
+                await self.write_queue.put(None)
+                await self._writer_task
+            
+            # Writer encerrado: nenhuma escrita pendente na conexão
+            self.conn.close()
+            
             if self.session:
-                await self.session.close()
+                await self.session.aclose()
                 self.logger.info("🔌 Sessão HTTP fechada")
 
 async def main():